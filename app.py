@@ -12,8 +12,10 @@ from models.repeated_prisoners_dilemma import RepeatedPrisonersDilemma
 from models.signaling_game import SignalingGame
 from models.colonel_blotto_game import ColonelBlottoGame
 from models.ultimatum_game import UltimatumGame
-from visualize import plot_payoff_matrix, get_game_labels
+from visualize import plot_payoff_matrix, get_game_labels, describe_equilibrium
+from models.equilibrium import solve
 from models.life_expectancy_calculator_model import LifeExpectancyCalculator
+from models.country_data import load_country_data
 
 st.set_page_config(page_title="Game Theory Simulator", layout="centered")
 st.title("🎲 Game Theory Simulator")
@@ -152,27 +154,31 @@ elif model_name == "Repeated Prisoner's Dilemma":
     
     strat_idx1 = strategies.index(strategy1)
     strat_idx2 = strategies.index(strategy2)
+    run_key = (tuple(model.params.items()), strat_idx1, strat_idx2)
     if st.button("Run Game"):
-        result = model.play_with_strategies(strat_idx1, strat_idx2)
+        # Keep the result across reruns so the history pages can be browsed
+        st.session_state["rpd_result"] = (run_key, model.play_with_strategies(strat_idx1, strat_idx2))
+
+    if st.session_state.get("rpd_result", (None, None))[0] == run_key:
+        result = st.session_state["rpd_result"][1]
         scores = result["scores"]
         history1 = result["history1"]
         history2 = result["history2"]
         st.success(f"Result: Player 1 Score {scores[0]:.2f}, Player 2 Score {scores[1]:.2f}")
         
-        # Show game history
+        # Show game history one page at a time; only the visible rounds are unpacked
         st.write("#### Game History")
-        history_data = []
-        for i in range(len(history1)):
-            history_data.append([
-                i+1, 
-                "Cooperate" if history1[i] == 0 else "Betray",
-                "Cooperate" if history2[i] == 0 else "Betray"
-            ])
+        page_size = 50
+        num_pages = max(1, (len(history1) + page_size - 1) // page_size)
+        page = st.number_input("Page", min_value=1, max_value=num_pages, value=1) - 1 if num_pages > 1 else 0
+        moves1 = history1.page(page, page_size)
+        moves2 = history2.page(page, page_size)
+        move_names = np.array(["Cooperate", "Betray"])
         
         st.table({
-            "Round": [row[0] for row in history_data],
-            "Player 1": [row[1] for row in history_data],
-            "Player 2": [row[2] for row in history_data]
+            "Round": list(range(page * page_size + 1, page * page_size + len(moves1) + 1)),
+            "Player 1": move_names[moves1].tolist(),
+            "Player 2": move_names[moves2].tolist()
         })
 
 elif model_name == "Signaling Game":
@@ -310,12 +316,8 @@ elif model_name == "Life Expectancy Calculator":
     height = st.sidebar.number_input("Height (cm)", min_value=50, max_value=250, value=170)
     weight = st.sidebar.number_input("Weight (kg)", min_value=20, max_value=300, value=70)
 
-    # Load country list from the CSV file with custom delimiter
-    import pandas as pd
-    country_data = pd.read_csv(r"data/life/life2025.csv", sep=r'\s+')
-    country_data.columns = country_data.columns.str.strip().str.replace('"', '')
-    country_data['Country'] = country_data['Country'].str.strip().str.replace('"', '')
-    countries = sorted(country_data['Country'].tolist())
+    # Country list from the shared country data, parsed once per process
+    countries = load_country_data().countries
 
     # Combine dropdown menu and text input for country selection
     region_dropdown = st.sidebar.selectbox("Select Country from Dropdown", countries, index=countries.index("New Zealand") if "New Zealand" in countries else 0)
@@ -345,6 +347,13 @@ elif model_name == "Life Expectancy Calculator":
         life_expectancy = LifeExpectancyCalculator.calculate(age, income, smoking, drinking, exercise, region, height, weight, gender, medical_history)
         st.write(f"Your estimated remaining life expectancy is {life_expectancy['remaining_life_expectancy']:.2f} years.")
         st.write(f"Your estimated total life expectancy is {life_expectancy['total_life_expectancy']:.2f} years.")
+        distribution = LifeExpectancyCalculator.calculate_distribution(age, income, smoking, drinking, exercise, region, height, weight, gender, medical_history, seed=0)
+        st.write(f"Across 10,000 simulated outcomes the total is {distribution['mean']:.2f} years on average, "
+                 f"with 90% between {distribution['percentiles'][5]:.2f} and {distribution['percentiles'][95]:.2f} years.")
+        actuarial = LifeExpectancyCalculator.calculate_actuarial(age, income, smoking, drinking, exercise, region, height, weight, gender, medical_history)
+        st.write(f"From the {region} life table for your sex and risk profile (hazard x{actuarial['hazard_multiplier']:.2f}), "
+                 f"your expected total life span is {actuarial['total_life_expectancy']:.2f} years.")
+        st.line_chart({"Probability of being alive": actuarial["survival"]})
 
 st.markdown("---")
 st.markdown("**Model Introduction:**")
@@ -363,3 +372,13 @@ if model_name in ["Prisoner's Dilemma", "Stag Hunt", "Coordination Game", "Hawk-
             st.pyplot(fig)
     except Exception as e:
         st.warning(f"Could not display payoff matrix visualization: {str(e)}")
+
+    st.markdown("**Nash Equilibria:**")
+    try:
+        # Cached on the model parameters, so slider reruns do not re-solve the game
+        solution = solve(model)
+        row_labels, col_labels = get_game_labels(model_name)
+        for (x, y), (u1, u2) in zip(solution["equilibria"], solution["payoffs"]):
+            st.write(f"- {describe_equilibrium(x, y, row_labels, col_labels)} → payoffs ({u1:.2f}, {u2:.2f})")
+    except Exception as e:
+        st.warning(f"Could not compute equilibria: {str(e)}")
@@ -0,0 +1,132 @@
+"""
+Score a CSV of individuals with the life expectancy calculator.
+
+Reads the input in chunks, scores each chunk with the vectorized
+LifeExpectancyCalculator.calculate_batch() in a pool of worker processes,
+and writes the results in input order as soon as they are ready. At most
+--max-in-flight chunks are held in memory at a time, so files of any size
+can be scored.
+
+Input columns: age, income, smoking, drinking, exercise, region, height,
+weight, gender, and either diabetes / hypertension / heart_disease flag
+columns or a medical_history column such as "diabetes;hypertension".
+
+Usage:
+    python life_expectancy_calculator.py people.csv -o scores.csv --workers 4
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from models.life_expectancy_calculator_model import LifeExpectancyCalculator, DEFAULT_PERCENTILES
+
+
+def score_chunk(chunk, index, seed_entropy, samples):
+    """
+    Score one chunk and return (rows, CSV text); the first chunk carries the
+    header. The random stream depends only on the seed and the chunk index.
+    """
+    if 'medical_history' in chunk.columns:
+        chunk = chunk.assign(medical_history=chunk['medical_history'].fillna('').astype(str))
+    rng = np.random.default_rng([seed_entropy, index])
+    scores = LifeExpectancyCalculator.calculate_batch(chunk, rng=rng)
+    result = chunk.assign(**scores)
+    if samples:
+        distribution = LifeExpectancyCalculator.calculate_batch_distribution(chunk, samples=samples, seed=rng)
+        result['mean_total_life_expectancy'] = distribution['mean']
+        for column, q in enumerate(DEFAULT_PERCENTILES):
+            result[f'p{q}_total_life_expectancy'] = distribution['percentiles'][:, column]
+    # Formatting happens in the worker so the parent process only writes text
+    return len(result), result.to_csv(header=index == 0, index=False)
+
+
+class _InProcess:
+    """Stand-in for a process pool when --workers is 0 or 1."""
+
+    class _Done:
+        def __init__(self, value):
+            self._value = value
+
+        def result(self):
+            return self._value
+
+    def submit(self, function, *args):
+        return self._Done(function(*args))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def score_file(input_path, output, chunk_size=100000, workers=None, max_in_flight=None, seed=None, samples=0,
+               progress=None):
+    """
+    Score input_path chunk by chunk and write CSV rows to the output file object.
+
+    Returns the number of rows written.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    max_in_flight = max_in_flight or 2 * max(workers, 1)
+    seed_entropy = np.random.SeedSequence(seed).entropy
+
+    rows = 0
+    start_time = time.perf_counter()
+
+    def write(result):
+        nonlocal rows
+        count, text = result
+        output.write(text)
+        rows += count
+        if progress:
+            elapsed = time.perf_counter() - start_time
+            progress(rows, rows / elapsed if elapsed > 0 else float('inf'))
+
+    executor = ProcessPoolExecutor(workers) if workers > 1 else _InProcess()
+    with executor:
+        pending = deque()
+        for index, chunk in enumerate(pd.read_csv(input_path, chunksize=chunk_size)):
+            pending.append(executor.submit(score_chunk, chunk, index, seed_entropy, samples))
+            # Results are written in submission order; waiting on the oldest bounds memory
+            if len(pending) >= max_in_flight:
+                write(pending.popleft().result())
+        while pending:
+            write(pending.popleft().result())
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV of individuals with the life expectancy calculator.")
+    parser.add_argument("input", help="input CSV file")
+    parser.add_argument("-o", "--output", help="output CSV file (default: standard output)")
+    parser.add_argument("--chunk-size", type=int, default=100000, help="rows per chunk (default: 100000)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count; 0 or 1 runs in-process)")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="chunks held in memory at once (default: twice the workers)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible random factors")
+    parser.add_argument("--samples", type=int, default=0, help="also add Monte Carlo mean and percentiles from this many samples per person")
+    parser.add_argument("--quiet", action="store_true", help="do not report progress")
+    args = parser.parse_args(argv)
+
+    def report(rows, rate):
+        print(f"\r{rows:,} rows scored ({rate:,.0f} rows/s)", end="", file=sys.stderr, flush=True)
+
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        rows = score_file(args.input, output, args.chunk_size, args.workers, args.max_in_flight, args.seed,
+                          args.samples, None if args.quiet else report)
+    finally:
+        if args.output:
+            output.close()
+    if not args.quiet:
+        print(f"\nDone: {rows:,} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
-from .core import GameModel
+from .core import GameModel, bimatrix
 
 class BattleOfSexes(GameModel):
     name = "Battle of Sexes"
     description = "A coordination game representing conflict of interest between two players who need to coordinate but have different preferences for the activity they choose."
     row_labels = ["Opera", "Football"]
     col_labels = ["Opera", "Football"]
+    vectorized_params = True
 
     def __init__(self, opera_man=2, opera_woman=1, football_man=1, football_woman=2):
         super().__init__({
@@ -31,3 +32,11 @@ class BattleOfSexes(GameModel):
         else:
             # They go to different activities - both get 0
             return 0, 0
+
+    def payoff_tensor(self):
+        opera_man = self.params['opera_man']
+        opera_woman = self.params['opera_woman']
+        football_man = self.params['football_man']
+        football_woman = self.params['football_woman']
+        return bimatrix([[opera_man, 0], [0, football_man]],
+                        [[opera_woman, 0], [0, football_woman]])
@@ -1,6 +1,14 @@
 from .core import GameModel
+from .equilibrium import solve_zero_sum
+from functools import lru_cache
+from math import comb
+from itertools import permutations
+from statistics import NormalDist
 import numpy as np
 
+# Upper bound on battlefield comparisons held in memory at once by the block engine
+MAX_BLOCK_CELLS = 2 ** 24
+
 class ColonelBlottoGame(GameModel):
     name = "Colonel Blotto Game"
     description = "A classic game of strategic resource allocation across multiple battlefields. Players must distribute limited resources, with the player allocating more to a battlefield winning that field."
@@ -52,6 +60,39 @@ class ColonelBlottoGame(GameModel):
         
         return wins1, wins2, battlefield_results
     
+    def play_batch(self, allocations1, allocations2):
+        """
+        Vectorized play() over arrays of allocations.
+
+        allocations1, allocations2: integer arrays of shape (..., battlefields);
+        leading dimensions broadcast against each other
+
+        Returns (wins1, wins2, battlefield_results) where battlefield_results
+        uses the same coding as play(): 1 = Player 1 wins, 2 = Player 2 wins, 0 = Tie
+        """
+        resources = self.params['resources']
+        battlefields = self.params['battlefields']
+
+        allocations1 = np.asarray(allocations1)
+        allocations2 = np.asarray(allocations2)
+
+        # Validate allocations
+        if allocations1.shape[-1:] != (battlefields,) or allocations2.shape[-1:] != (battlefields,):
+            raise ValueError(f"Allocations must have exactly {battlefields} elements")
+
+        if (allocations1.sum(axis=-1) > resources).any() or (allocations2.sum(axis=-1) > resources).any():
+            raise ValueError(f"Total resources cannot exceed {resources}")
+
+        if (allocations1 < 0).any() or (allocations2 < 0).any():
+            raise ValueError("Allocations cannot be negative")
+
+        # Determine the winner of each battlefield
+        won1 = allocations1 > allocations2
+        won2 = allocations2 > allocations1
+        battlefield_results = won1 * np.int8(1) + won2 * np.int8(2)
+
+        return won1.sum(axis=-1), won2.sum(axis=-1), battlefield_results
+
     def play_simple(self, strategy1, strategy2):
         """
         Simplified interface for playing the game with predefined strategies
@@ -74,6 +115,39 @@ class ColonelBlottoGame(GameModel):
         wins1, wins2, _ = self.play(allocation1, allocation2)
         return wins1, wins2
     
+    def payoff_tensor(self):
+        """
+        Expected battlefields won for every pair of preset strategies, shape (2, 4, 4).
+
+        Wins are a sum over battlefields, so against the Random Distribution
+        strategy only the number of units it puts on each battlefield
+        matters. That number is Binomial(resources, 1 / battlefields), which
+        makes the tensor exact and the same on every call.
+        """
+        resources = self.params['resources']
+        battlefields = self.params['battlefields']
+        pmf = np.array([comb(resources, k) for k in range(resources + 1)], dtype=float) \
+            * (1 / battlefields) ** np.arange(resources + 1) * (1 - 1 / battlefields) ** np.arange(resources, -1, -1)
+        cdf = np.cumsum(pmf)
+        fewer = cdf - pmf   # P(random side places fewer than k units)
+        more = 1 - cdf      # P(random side places more than k units)
+
+        fixed = [np.array(self._generate_allocation(strategy)) for strategy in range(3)]
+        wins = np.zeros((2, 4, 4))
+        for s1 in range(4):
+            for s2 in range(4):
+                if s1 < 3 and s2 < 3:
+                    won1, won2, _ = self.play_batch(fixed[s1], fixed[s2])
+                elif s1 < 3:
+                    won1, won2 = fewer[fixed[s1]].sum(), more[fixed[s1]].sum()
+                elif s2 < 3:
+                    won1, won2 = more[fixed[s2]].sum(), fewer[fixed[s2]].sum()
+                else:
+                    # Both random: the battlefields are symmetric and independent draws
+                    won1 = won2 = battlefields * float(pmf @ fewer)
+                wins[:, s1, s2] = won1, won2
+        return wins
+
     def _generate_allocation(self, strategy):
         """Generate resource allocation based on strategy"""
         resources = self.params['resources']
@@ -117,17 +191,178 @@ class ColonelBlottoGame(GameModel):
                 allocation[i] += 1
                 
         elif strategy == 3:  # Random allocation
-            # Generate random distribution that sums to resources
-            allocation = np.zeros(battlefields, dtype=int)
-            for _ in range(resources):
-                idx = np.random.randint(0, battlefields)
-                allocation[idx] += 1
+            # Each resource unit goes to a uniformly random battlefield: one multinomial draw
+            allocation = np.random.multinomial(resources, [1 / battlefields] * battlefields)
                 
         else:
             raise ValueError("Invalid strategy")
         
         return allocation.tolist() if isinstance(allocation, np.ndarray) else allocation
     
+    def sample_allocations(self, n, method="multinomial", concentration=1.0, rng=None):
+        """
+        Draw n random allocations at once, as an int array of shape (n, battlefields)
+        
+        method:
+            "multinomial" = every resource unit goes to a uniformly random
+                battlefield (the Random Distribution strategy)
+            "dirichlet" = battlefield shares drawn from a symmetric Dirichlet
+                with the given concentration, then rounded to whole units by
+                largest remainder so that all resources are used
+        """
+        resources = self.params['resources']
+        battlefields = self.params['battlefields']
+        rng = rng or np.random.default_rng()
+        
+        if method == "multinomial":
+            return rng.multinomial(resources, [1 / battlefields] * battlefields, size=n)
+        if method != "dirichlet":
+            raise ValueError(f"Unknown sampling method '{method}'")
+        
+        shares = rng.dirichlet([concentration] * battlefields, size=n) * resources
+        allocations = np.floor(shares).astype(np.int64)
+        remainder = resources - allocations.sum(axis=1)
+        # Give the leftover units to the battlefields with the largest fractional parts
+        order = np.argsort(allocations - shares, axis=1)
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(battlefields)[None, :].repeat(n, axis=0), axis=1)
+        return allocations + (ranks < remainder[:, None])
+
+    def estimate_win_rates(self, strategy=3, opponents=(0, 1, 2, 3), samples=1000000, method="multinomial",
+                           batch_size=262144, seed=None, confidence=0.95):
+        """
+        Monte Carlo win rates of one strategy against several opponents
+        
+        Random strategies draw a fresh allocation for every sample (with the
+        given sampling method); preset strategies always play the same
+        allocation. Samples are scored in vectorized batches of batch_size.
+        
+        Returns a dict keyed by opponent strategy name, each holding
+        "win_rate", "tie_rate", "loss_rate", a Wilson "win_rate_ci" at the
+        given confidence, and the "mean_margin" of battlefields won minus lost
+        """
+        rng = np.random.default_rng(seed)
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        results = {}
+        for opponent in opponents:
+            wins = ties = 0
+            margin_total = 0
+            for start in range(0, samples, batch_size):
+                n = min(batch_size, samples - start)
+                allocations1 = self._strategy_allocations(strategy, n, method, rng)
+                allocations2 = self._strategy_allocations(opponent, n, method, rng)
+                wins1, wins2, _ = self.play_batch(allocations1, allocations2)
+                margin = wins1 - wins2
+                wins += int((margin > 0).sum())
+                ties += int((margin == 0).sum())
+                margin_total += int(margin.sum())
+            
+            # Wilson score interval for the win probability
+            p = wins / samples
+            centre = (p + z ** 2 / (2 * samples)) / (1 + z ** 2 / samples)
+            half_width = z * np.sqrt(p * (1 - p) / samples + z ** 2 / (4 * samples ** 2)) / (1 + z ** 2 / samples)
+            results[self.get_strategy_name(opponent)] = {
+                "win_rate": p,
+                "tie_rate": ties / samples,
+                "loss_rate": (samples - wins - ties) / samples,
+                "win_rate_ci": (float(centre - half_width), float(centre + half_width)),
+                "mean_margin": margin_total / samples
+            }
+        return results
+
+    def _strategy_allocations(self, strategy, n, method, rng):
+        """n allocations for a preset strategy, sampling fresh ones for Random Distribution"""
+        if strategy == 3:
+            return self.sample_allocations(n, method, rng=rng)
+        return np.broadcast_to(np.array(self._generate_allocation(strategy)), (n, self.params['battlefields']))
+
+    def enumerate_allocations(self):
+        """
+        Every way to split all resources over the battlefields, as an int array of
+        shape (C(resources + battlefields - 1, battlefields - 1), battlefields)
+        """
+        return _compositions(self.params['resources'], self.params['battlefields']).copy()
+
+    def payoff_blocks(self, allocations1, allocations2, block_cells=MAX_BLOCK_CELLS):
+        """
+        Yield (row_start, block) pieces of the zero-sum payoff matrix
+        
+        block[i, j] is battlefields won minus battlefields lost by
+        allocations1[row_start + i] against allocations2[j]. Rows are grouped so
+        that each block compares at most block_cells battlefields, keeping memory
+        bounded however many allocations there are.
+        """
+        allocations1 = np.asarray(allocations1)
+        allocations2 = np.asarray(allocations2)
+        rows_per_block = max(1, block_cells // (len(allocations2) * allocations2.shape[1]))
+        for start in range(0, len(allocations1), rows_per_block):
+            block = allocations1[start:start + rows_per_block, None, :] - allocations2[None, :, :]
+            yield start, np.sign(block).sum(axis=-1, dtype=np.int8)
+
+    def allocation_payoff_matrix(self, allocations=None):
+        """Full zero-sum payoff matrix between all allocations (only sensible for small games)"""
+        if allocations is None:
+            allocations = self.enumerate_allocations()
+        return np.concatenate([block for _, block in self.payoff_blocks(allocations, allocations)])
+
+    def expected_payoffs(self, allocations, mixed_strategy, opponent_allocations=None):
+        """
+        Expected zero-sum payoff of each allocation against a mixed strategy over
+        opponent_allocations (all allocations by default), computed block by block
+        """
+        if opponent_allocations is None:
+            opponent_allocations = self.enumerate_allocations()
+        allocations = np.asarray(allocations)
+        values = np.empty(len(allocations))
+        for start, block in self.payoff_blocks(allocations, opponent_allocations):
+            values[start:start + len(block)] = block @ mixed_strategy
+        return values
+
+    def solve_mixed(self):
+        """
+        Solve the mixed equilibrium of the exact game over all allocations
+        
+        The game is unchanged by relabelling battlefields, so the linear program
+        is solved over allocations sorted in decreasing order (partitions of the
+        resources), each playing against the battlefield-symmetrised opponent.
+        The optimal partition mix is spread uniformly over each partition's
+        permutations, which is optimal in the full game. The payoff is
+        battlefields won minus battlefields lost.
+        
+        Returns a dict with "allocations", their equilibrium "probabilities",
+        the game "value" (0 by symmetry), "partitions" with their
+        "partition_probabilities", and "exploitability" (best-response gain
+        against the equilibrium, 0 up to rounding)
+        """
+        allocations = self.enumerate_allocations()
+        partitions, partition_index = _partitions(allocations)
+        reduced = self._symmetrised_payoffs(partitions)
+
+        x, _, value = solve_zero_sum(reduced)
+
+        orbit_sizes = np.bincount(partition_index, minlength=len(partitions))
+        probabilities = x[partition_index] / orbit_sizes[partition_index]
+        exploitability = float((reduced @ x).max() - value)
+
+        return {
+            "allocations": allocations,
+            "probabilities": probabilities,
+            "value": float(value),
+            "partitions": partitions,
+            "partition_probabilities": x,
+            "exploitability": exploitability
+        }
+
+    def _symmetrised_payoffs(self, partitions):
+        """Payoff of each partition against each partition averaged over all battlefield orders"""
+        battlefields = self.params['battlefields']
+        orders = list(permutations(range(battlefields)))
+        total = np.zeros((len(partitions), len(partitions)))
+        for order in orders:
+            for start, block in self.payoff_blocks(partitions, partitions[:, order]):
+                total[start:start + len(block)] += block
+        return total / len(orders)
+
     def get_strategy_name(self, strategy):
         """Return the name of a strategy"""
         strategy_names = {
@@ -137,3 +372,22 @@ class ColonelBlottoGame(GameModel):
             3: "Random Distribution"
         }
         return strategy_names.get(strategy, "Unknown Strategy")
+
+
+@lru_cache(maxsize=32)
+def _compositions(total, parts):
+    """All non-negative integer vectors of length parts summing to total, in lexicographic order."""
+    if parts == 1:
+        return np.array([[total]], dtype=np.int16)
+    blocks = []
+    for first in range(total + 1):
+        rest = _compositions(total - first, parts - 1)
+        blocks.append(np.column_stack([np.full(len(rest), first, dtype=np.int16), rest]))
+    return np.concatenate(blocks)
+
+
+def _partitions(allocations):
+    """Distinct allocations sorted in decreasing order, and which one each allocation is a permutation of."""
+    canonical = -np.sort(-allocations, axis=1)
+    partitions, index = np.unique(canonical, axis=0, return_inverse=True)
+    return partitions, index.ravel()
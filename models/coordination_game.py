@@ -1,8 +1,9 @@
-from .core import GameModel
+from .core import GameModel, bimatrix
 
 class CoordinationGame(GameModel):
     name = "Coordination Game"
     description = "A game where players benefit from coordinating their actions, demonstrating the importance of coordination in social situations."
+    vectorized_params = True
 
     def __init__(self, coord_a=3, coord_b=3, mismatch=0):
         super().__init__({'coord_a': coord_a, 'coord_b': coord_b, 'mismatch': mismatch})
@@ -16,3 +17,8 @@ class CoordinationGame(GameModel):
             return coord_b, coord_b
         else:
             return mismatch, mismatch
+
+    def payoff_tensor(self):
+        coord_a, coord_b, mismatch = self.params['coord_a'], self.params['coord_b'], self.params['mismatch']
+        return bimatrix([[coord_a, mismatch], [mismatch, coord_b]],
+                        [[coord_a, mismatch], [mismatch, coord_b]])
@@ -1,5 +1,19 @@
 import numpy as np
 
+
+def bimatrix(p1, p2):
+    """
+    Stack nested payoff lists into a float array of shape (2, |A1|, |A2|, ...).
+
+    Entries may be scalars or arrays; they are broadcast against each other so
+    that array-valued parameters produce trailing batch dimensions.
+    """
+    rows, cols = len(p1), len(p1[0])
+    cells = [cell for row in p1 for cell in row] + [cell for row in p2 for cell in row]
+    cells = np.broadcast_arrays(*[np.asarray(cell, dtype=float) for cell in cells])
+    return np.stack(cells).reshape((2, rows, cols) + cells[0].shape)
+
+
 class GameModel:
     """
     Base class for game models. All specific models should inherit from this class.
@@ -8,6 +22,8 @@ class GameModel:
     description = "Base class for game models"
     row_labels = ["Action 0", "Action 1"]
     col_labels = ["Action 0", "Action 1"]
+    # True when payoff_tensor() accepts array-valued params and broadcasts them
+    vectorized_params = False
 
     def __init__(self, params=None):
         self.params = params or {}
@@ -16,6 +32,41 @@ class GameModel:
         """Run a game and return the result."""
         raise NotImplementedError
 
+    def payoff_tensor(self):
+        """
+        Return the numeric payoffs as an array of shape (players, |A1|, |A2|, ...).
+
+        Entry [p, a1, a2] is player p's payoff for the action profile (a1, a2).
+        The default implementation calls play() once per cell; subclasses with
+        a closed form should override it.
+        """
+        p1 = []
+        p2 = []
+        for a1 in range(len(self.row_labels)):
+            row1 = []
+            row2 = []
+            for a2 in range(len(self.col_labels)):
+                payoffs = self.play(a1, a2)
+                row1.append(payoffs[0])
+                row2.append(payoffs[1])
+            p1.append(row1)
+            p2.append(row2)
+        return bimatrix(p1, p2)
+
+    def play_batch(self, actions1, actions2):
+        """
+        Vectorized play() over arrays of action indices.
+
+        Looks every action pair up in payoff_tensor() with a single gather and
+        returns (payoffs1, payoffs2) with the broadcast shape of the inputs.
+        Subclasses whose play() takes continuous amounts override this.
+        """
+        payoffs = self.payoff_tensor()
+        actions1 = _check_actions(actions1, payoffs.shape[1])
+        actions2 = _check_actions(actions2, payoffs.shape[2])
+        result = payoffs[:, actions1, actions2]
+        return result[0], result[1]
+
     def summary(self):
         """Return a brief description of the model."""
         return self.description
@@ -26,19 +77,15 @@ class GameModel:
         Should be overridden by subclasses for custom implementations.
         """
         try:
-            # Default implementation for 2x2 games
-            results = []
-            for a1 in [0, 1]:
-                row = []
-                for a2 in [0, 1]:
-                    payoffs = self.play(a1, a2)
-                    row.append(f"{payoffs[0]}, {payoffs[1]}")
-                results.append(row)
-            
+            payoffs = self.payoff_tensor()
+            results = [[f"{_format_payoff(payoffs[0, i, j])}, {_format_payoff(payoffs[1, i, j])}"
+                        for j in range(payoffs.shape[2])]
+                       for i in range(payoffs.shape[1])]
+
             # Ensure we return a 2D array
             matrix = np.array(results)
-            if matrix.shape != (2, 2):
-                # If we don't have a 2x2 matrix, create a default one
+            if matrix.ndim != 2:
+                # If we don't have a 2D matrix, create a default one
                 matrix = np.array([["0, 0", "0, 0"], ["0, 0", "0, 0"]])
             
             return matrix
@@ -46,3 +93,17 @@ class GameModel:
         except Exception as e:
             # Return a default 2x2 matrix in case of any error
             return np.array([["0, 0", "0, 0"], ["0, 0", "0, 0"]])
+
+
+def _check_actions(actions, num_actions):
+    """Convert actions to an index array, rejecting out-of-range values instead of wrapping."""
+    actions = np.asarray(actions)
+    if actions.size and (actions.min() < 0 or actions.max() >= num_actions):
+        raise ValueError(f"Actions must be between 0 and {num_actions - 1}")
+    return actions.astype(np.intp, copy=False)
+
+
+def _format_payoff(value):
+    """Format a payoff for display, dropping the trailing .0 on whole numbers."""
+    value = float(value)
+    return str(int(value)) if value.is_integer() else str(value)
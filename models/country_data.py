@@ -0,0 +1,108 @@
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "life", "life2025.csv")
+
+# Defaults for columns the CSV does not provide
+DEFAULT_HEALTHCARE_QUALITY = 50
+DEFAULT_POLLUTION_LEVEL = 30
+
+
+def normalize_name(name):
+    """Key used to look up a country: quotes removed, whitespace collapsed, case folded."""
+    return " ".join(str(name).replace('"', '').split()).casefold()
+
+
+class CountryData:
+    """
+    Per-country life expectancy data held as parallel NumPy arrays.
+
+    Countries are addressed by integer codes (row positions). A dict from
+    normalized names to codes makes every lookup O(1), and the derived
+    columns the calculator needs are computed once up front.
+
+    Attributes (arrays indexed by country code):
+    - names: country names as written in the data, without quotes or padding
+    - life_expectancy, females, males: life expectancy at birth
+    - healthcare_quality, pollution_level, obesity_rate: derived inputs
+    """
+
+    def __init__(self, names, life_expectancy, females, males, healthcare_quality=None, pollution_level=None,
+                 obesity_rate=None):
+        self.names = np.asarray(names, dtype=object)
+        self.life_expectancy = np.asarray(life_expectancy, dtype=float)
+        self.females = np.asarray(females, dtype=float)
+        self.males = np.asarray(males, dtype=float)
+        count = len(self.names)
+        self.healthcare_quality = np.full(count, DEFAULT_HEALTHCARE_QUALITY, dtype=float) \
+            if healthcare_quality is None else np.asarray(healthcare_quality, dtype=float)
+        self.pollution_level = np.full(count, DEFAULT_POLLUTION_LEVEL, dtype=float) \
+            if pollution_level is None else np.asarray(pollution_level, dtype=float)
+        self.obesity_rate = (self.females + self.males) / 2 * 0.1 \
+            if obesity_rate is None else np.asarray(obesity_rate, dtype=float)
+        self._index = {normalize_name(name): code for code, name in enumerate(self.names)}
+
+    @classmethod
+    def from_csv(cls, path=DEFAULT_PATH):
+        """Parse a whitespace-separated file with quoted country names, like data/life/life2025.csv."""
+        table = pd.read_csv(path, sep=r'\s+')
+        table.columns = table.columns.str.strip().str.replace('"', '')
+        if 'Country' not in table.columns:
+            raise ValueError("The CSV file does not have a 'Country' column.")
+        optional = {column: table[column] if column in table.columns else None
+                    for column in ('HealthcareQuality', 'PollutionLevel', 'ObesityRate')}
+        return cls(table['Country'].str.replace('"', '').str.strip(), table['Life Expectancy'],
+                   table['Females'], table['Males'], optional['HealthcareQuality'], optional['PollutionLevel'],
+                   optional['ObesityRate'])
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return normalize_name(name) in self._index
+
+    @property
+    def countries(self):
+        """Sorted list of country names, for pickers."""
+        return sorted(self.names.tolist())
+
+    def code(self, name):
+        """Integer code of a country."""
+        code = self._index.get(normalize_name(name))
+        if code is None:
+            raise ValueError(f"Region '{str(name).strip()}' not found in the CSV file.")
+        return code
+
+    def codes(self, names):
+        """Integer codes for an array of country names, looking up each distinct name once."""
+        inverse, unique = pd.factorize(np.asarray(names, dtype=object).ravel())
+        return np.array([self.code(name) for name in unique], dtype=np.intp)[inverse]
+
+    def sex_life_expectancy(self, gender):
+        """Life expectancy column for "Male" or "Female"."""
+        if gender == "Male":
+            return self.males
+        if gender == "Female":
+            return self.females
+        raise ValueError("The CSV file does not have the required gender column to calculate 'LifeExpectancyAdjustment'.")
+
+    def row(self, name):
+        """All values for one country as a dict."""
+        code = self.code(name)
+        return {
+            "Country": self.names[code],
+            "Life Expectancy": float(self.life_expectancy[code]),
+            "Females": float(self.females[code]),
+            "Males": float(self.males[code]),
+            "HealthcareQuality": float(self.healthcare_quality[code]),
+            "PollutionLevel": float(self.pollution_level[code]),
+            "ObesityRate": float(self.obesity_rate[code])
+        }
+
+
+@lru_cache(maxsize=None)
+def load_country_data(path=DEFAULT_PATH):
+    """Shared CountryData for a file, parsed on first use."""
+    return CountryData.from_csv(path)
@@ -20,3 +20,19 @@ class DictatorGame(GameModel):
         payoff_recipient = amount_given
         
         return payoff_dictator, payoff_recipient
+
+    def play_batch(self, amounts_given):
+        """
+        Vectorized play() over an array of amounts given.
+
+        Returns (dictator_payoffs, recipient_payoffs) arrays.
+        """
+        total_amount = self.params['total_amount']
+        amounts_given = np.clip(amounts_given, 0, total_amount)
+        return total_amount - amounts_given, amounts_given
+
+    def payoff_tensor(self):
+        """Payoffs for every integer amount given, shape (2, total_amount + 1)."""
+        total_amount = self.params['total_amount']
+        amount_given = np.arange(0, total_amount + 1)
+        return np.stack([total_amount - amount_given, amount_given]).astype(float)
@@ -0,0 +1,182 @@
+import numpy as np
+from .repeated_prisoners_dilemma import RepeatedPrisonersDilemma
+from .tournament import round_robin
+
+# Dormand-Prince 5(4) coefficients
+_DP_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+_DP_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+_DP_B5 = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+_DP_B4 = np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+
+
+def strategy_payoff_matrix(model, strategies=None):
+    """
+    Payoff matrix A for evolutionary dynamics, where A[i, j] is what strategy i earns against j.
+
+    For RepeatedPrisonersDilemma the strategies are played against each other
+    in a round robin; for a symmetric 2x2 GameModel it is player 1's payoffs.
+    """
+    if isinstance(model, RepeatedPrisonersDilemma):
+        return round_robin(model, strategies)["scores"]
+    payoffs = model.payoff_tensor()
+    if payoffs.ndim != 3 or not np.allclose(payoffs[0], payoffs[1].T):
+        raise ValueError("Evolutionary dynamics need a symmetric two-player game")
+    return payoffs[0]
+
+
+def replicator_rhs(payoffs, x):
+    """Replicator equation x_i' = x_i ((A x)_i - x.A x) for a batch of states x (batch, n)."""
+    fitness = x @ payoffs.T
+    average = (x * fitness).sum(axis=1, keepdims=True)
+    return x * (fitness - average)
+
+
+def replicator(payoffs, x0, times=(100.0,), rtol=1e-6, atol=1e-9, max_steps=1000000):
+    """
+    Integrate the replicator equation for many initial conditions at once.
+
+    Uses an adaptive Dormand-Prince RK45 scheme in which every trajectory
+    keeps its own step size, so stiff and slow trajectories in the same batch
+    do not hold each other back. Each step is a handful of matrix products
+    over the whole batch.
+
+    Parameters:
+    - payoffs: (n, n) payoff matrix
+    - x0: initial population shares, shape (n,) or (batch, n)
+    - times: increasing output times
+    - rtol, atol: error tolerances of the step-size controller
+
+    Returns:
+    - array of states at each output time, shape (len(times), batch, n)
+      (or (len(times), n) for a single initial condition)
+    """
+    payoffs = np.asarray(payoffs, dtype=float)
+    x = np.atleast_2d(np.asarray(x0, dtype=float)).copy()
+    single = np.ndim(x0) == 1
+
+    t = np.zeros(len(x))
+    dt = np.full(len(x), 1e-2)
+    outputs = []
+    steps = 0
+    for t_end in times:
+        active = t < t_end
+        while active.any():
+            steps += 1
+            if steps > max_steps:
+                raise RuntimeError("Replicator integration exceeded max_steps")
+
+            rows = np.flatnonzero(active)
+            h = np.minimum(dt[rows], t_end - t[rows])[:, None]
+            x_new, error = _dormand_prince_step(payoffs, x[rows], h)
+
+            scale = atol + rtol * np.maximum(np.abs(x[rows]), np.abs(x_new))
+            error_norm = np.sqrt(np.mean((error / scale) ** 2, axis=1))
+            accepted = error_norm <= 1
+
+            accepted_rows = rows[accepted]
+            # Clip tiny negative drift so states stay on the simplex
+            x_new = np.clip(x_new[accepted], 0, None)
+            x[accepted_rows] = x_new / x_new.sum(axis=1, keepdims=True)
+            t[accepted_rows] += h[accepted, 0]
+
+            # Standard step-size update with a safety factor
+            with np.errstate(divide='ignore'):
+                factor = np.clip(0.9 * error_norm ** -0.2, 0.2, 5.0)
+            dt[rows] = h[:, 0] * factor
+            active = t < t_end - 1e-12
+        outputs.append(x.copy())
+
+    outputs = np.array(outputs)
+    return outputs[:, 0] if single else outputs
+
+
+def _dormand_prince_step(payoffs, x, h):
+    """One embedded RK45 step for a batch; returns the 5th-order state and the error estimate."""
+    k = [replicator_rhs(payoffs, x)]
+    for stage in range(1, 7):
+        increment = sum(a * k_i for a, k_i in zip(_DP_A[stage], k))
+        k.append(replicator_rhs(payoffs, x + h * increment))
+    k = np.stack(k)
+    x_new = x + h * np.tensordot(_DP_B5, k, axes=1)
+    error = h * np.tensordot(_DP_B5 - _DP_B4, k, axes=1)
+    return x_new, error
+
+
+def imitation(payoffs, x0, generations=1000, selection_strength=1.0, record_every=None):
+    """
+    Discrete-generation imitation dynamics for many populations at once.
+
+    Each generation, individuals compare payoffs with a random other member
+    and switch to their strategy with the Fermi probability
+    1 / (1 + exp(-s (f_other - f_own))). In the large-population limit the
+    share of strategy i changes by x_i sum_j x_j tanh(s (f_i - f_j) / 2).
+
+    Parameters:
+    - payoffs: (n, n) payoff matrix
+    - x0: initial population shares, shape (n,) or (batch, n)
+    - generations: number of generations
+    - selection_strength: intensity of selection s
+    - record_every: if set, also return the states every that many generations
+
+    Returns:
+    - final states, or (final states, recorded states) when record_every is set
+    """
+    payoffs = np.asarray(payoffs, dtype=float)
+    x = np.atleast_2d(np.asarray(x0, dtype=float)).copy()
+    single = np.ndim(x0) == 1
+
+    recorded = []
+    for generation in range(generations):
+        if record_every and generation % record_every == 0:
+            recorded.append(x.copy())
+        fitness = x @ payoffs.T
+        pressure = np.tanh(selection_strength * (fitness[:, :, None] - fitness[:, None, :]) / 2)
+        x = x + x * np.einsum('bij,bj->bi', pressure, x)
+
+    final = x[0] if single else x
+    if record_every:
+        recorded = np.array(recorded)
+        return final, (recorded[:, 0] if single else recorded)
+    return final
+
+
+def basins(payoffs, samples=1000, method="replicator", t_max=200.0, generations=2000,
+           selection_strength=1.0, threshold=0.99, seed=None):
+    """
+    Map basins of attraction by integrating many random initial conditions at once.
+
+    Initial shares are drawn uniformly from the simplex. Each run is labelled
+    with the strategy that takes over (share above threshold), or -1 if the
+    population ends mixed.
+
+    Returns:
+    - dict with "initial" and "final" states (samples, n), "attractor" labels,
+      and "basin_shares", the fraction of samples ending at each strategy
+    """
+    payoffs = np.asarray(payoffs, dtype=float)
+    rng = np.random.default_rng(seed)
+    initial = rng.dirichlet(np.ones(len(payoffs)), size=samples)
+
+    if method == "replicator":
+        final = replicator(payoffs, initial, times=(t_max,))[-1]
+    elif method == "imitation":
+        final = imitation(payoffs, initial, generations, selection_strength)
+    else:
+        raise ValueError(f"Unknown method '{method}'")
+
+    attractor = np.where(final.max(axis=1) >= threshold, final.argmax(axis=1), -1)
+    basin_shares = np.bincount(attractor[attractor >= 0], minlength=len(payoffs)) / samples
+    return {
+        "initial": initial,
+        "final": final,
+        "attractor": attractor,
+        "basin_shares": basin_shares
+    }
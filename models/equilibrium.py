@@ -0,0 +1,338 @@
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+import numpy as np
+
+# Support enumeration is exact but examines every pair of equal-size supports;
+# above this many pairs the solver switches to Lemke-Howson.
+MAX_SUPPORT_PAIRS = 20000
+
+TOLERANCE = 1e-9
+
+
+def solve(model, method="auto"):
+    """
+    Find Nash equilibria of a two-player game model.
+
+    Results are cached on the model class and its params, so calling this again
+    for a game with the same parameters (e.g. on a Streamlit rerun) does not
+    re-solve it. Models must accept their params as constructor keyword
+    arguments, which every model in this package does.
+
+    Parameters:
+    - model: a GameModel whose payoff_tensor() has shape (2, |A1|, |A2|)
+    - method: "auto", "support_enumeration" or "lemke_howson"
+
+    Returns:
+    - dict with "equilibria" (list of (x, y) mixed strategies over the full
+      action sets), "payoffs" (list of (u1, u2)), "method", and the "rows" and
+      "cols" left after iterated elimination of dominated strategies
+    """
+    return _solve_cached(type(model), _params_key(model.params), method)
+
+
+@lru_cache(maxsize=256)
+def _solve_cached(model_class, params_key, method):
+    model = model_class(**dict(params_key))
+    payoffs = model.payoff_tensor()
+    if payoffs.ndim != 3 or payoffs.shape[0] != 2:
+        raise ValueError("The equilibrium solver needs a two-player bimatrix game")
+    return solve_bimatrix(payoffs[0], payoffs[1], method)
+
+
+def _params_key(params):
+    """Turn a params dict into a hashable cache key."""
+    return tuple(sorted((name, _freeze(value)) for name, value in params.items()))
+
+
+def _freeze(value):
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def solve_bimatrix(A, B, method="auto"):
+    """
+    Find Nash equilibria of the bimatrix game (A, B).
+
+    A is the row player's payoff matrix and B the column player's. Strictly
+    dominated pure strategies are removed first, then the reduced game is solved
+    by support enumeration (all equilibria of non-degenerate games) or by
+    Lemke-Howson started from every label (a subset of equilibria, but it
+    scales to much larger games).
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    if A.shape != B.shape or A.ndim != 2:
+        raise ValueError("Payoff matrices must be 2D and have the same shape")
+
+    rows, cols = iterated_dominance(A, B)
+    A_reduced = A[np.ix_(rows, cols)]
+    B_reduced = B[np.ix_(rows, cols)]
+
+    if method == "auto":
+        pairs = sum(comb(len(rows), k) * comb(len(cols), k) for k in range(1, min(len(rows), len(cols)) + 1))
+        method = "support_enumeration" if pairs <= MAX_SUPPORT_PAIRS else "lemke_howson"
+
+    if method == "support_enumeration":
+        reduced = support_enumeration(A_reduced, B_reduced)
+    elif method == "lemke_howson":
+        reduced = []
+        for label in range(len(rows) + len(cols)):
+            try:
+                reduced.append(lemke_howson(A_reduced, B_reduced, initial_dropped_label=label))
+            except RuntimeError:
+                # Degenerate games can stall some starting labels; the others still count
+                continue
+        if not reduced:
+            raise RuntimeError("Lemke-Howson failed from every starting label")
+        reduced = _unique_equilibria(reduced)
+    else:
+        raise ValueError(f"Unknown method '{method}'")
+
+    equilibria = []
+    payoffs = []
+    for x_reduced, y_reduced in reduced:
+        x = np.zeros(A.shape[0])
+        y = np.zeros(A.shape[1])
+        x[rows] = x_reduced
+        y[cols] = y_reduced
+        x.setflags(write=False)
+        y.setflags(write=False)
+        equilibria.append((x, y))
+        payoffs.append((float(x @ A @ y), float(x @ B @ y)))
+
+    rows.setflags(write=False)
+    cols.setflags(write=False)
+    return {
+        "equilibria": equilibria,
+        "payoffs": payoffs,
+        "method": method,
+        "rows": rows,
+        "cols": cols
+    }
+
+
+def iterated_dominance(A, B):
+    """
+    Iteratively remove pure strategies strictly dominated by another pure strategy.
+
+    Returns the indices of the surviving rows and columns.
+    """
+    rows = np.arange(A.shape[0])
+    cols = np.arange(A.shape[1])
+    while True:
+        sub_A = A[np.ix_(rows, cols)]
+        sub_B = B[np.ix_(rows, cols)]
+
+        # Strategy j is dropped when some strategy i beats it against every opponent action
+        row_dominated = (sub_A[:, None, :] > sub_A[None, :, :]).all(axis=2).any(axis=0)
+        col_dominated = (sub_B.T[:, None, :] > sub_B.T[None, :, :]).all(axis=2).any(axis=0)
+
+        if not row_dominated.any() and not col_dominated.any():
+            return rows, cols
+        rows = rows[~row_dominated]
+        cols = cols[~col_dominated]
+
+
+def support_enumeration(A, B):
+    """
+    Enumerate equilibria by checking every pair of equal-size supports.
+
+    For each pair the indifference conditions are solved as a linear system;
+    the solution is kept when it is a probability vector and no action outside
+    the support earns more.
+    """
+    m, n = A.shape
+    equilibria = []
+    for k in range(1, min(m, n) + 1):
+        for I in combinations(range(m), k):
+            for J in combinations(range(n), k):
+                I_idx = list(I)
+                J_idx = list(J)
+                # Column mix y makes every row in I indifferent; row mix x does the same for J
+                y = _indifferent_mix(A[np.ix_(I_idx, J_idx)])
+                x = _indifferent_mix(B[np.ix_(I_idx, J_idx)].T)
+                if x is None or y is None:
+                    continue
+
+                x_full = np.zeros(m)
+                y_full = np.zeros(n)
+                x_full[I_idx] = x
+                y_full[J_idx] = y
+
+                row_values = A @ y_full
+                col_values = x_full @ B
+                if row_values.max() > row_values[I_idx].min() + 1e-7:
+                    continue
+                if col_values.max() > col_values[J_idx].min() + 1e-7:
+                    continue
+                equilibria.append((x_full, y_full))
+    return _unique_equilibria(equilibria)
+
+
+def _indifferent_mix(M):
+    """
+    Solve for a probability vector p with M @ p constant across rows.
+
+    Returns None if the system is singular or p has a negative entry.
+    """
+    k = M.shape[0]
+    system = np.zeros((k + 1, k + 1))
+    system[:k, :k] = M
+    system[:k, k] = -1
+    system[k, :k] = 1
+    rhs = np.zeros(k + 1)
+    rhs[k] = 1
+    try:
+        solution = np.linalg.solve(system, rhs)
+    except np.linalg.LinAlgError:
+        return None
+    p = solution[:k]
+    if (p < -TOLERANCE).any():
+        return None
+    p = np.clip(p, 0, None)
+    return p / p.sum()
+
+
+def lemke_howson(A, B, initial_dropped_label=0, max_pivots=10000):
+    """
+    Find one equilibrium with the Lemke-Howson complementary pivoting algorithm.
+
+    Labels 0..m-1 are the row player's strategies and m..m+n-1 the column
+    player's. Different initial labels can lead to different equilibria.
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    m, n = A.shape
+
+    # The algorithm needs strictly positive payoffs; shifting does not change equilibria
+    A = A - A.min() + 1
+    B = B - B.min() + 1
+
+    # Row tableau: constraints B^T x <= 1; columns are x (labels 0..m-1) then slacks (m..m+n-1)
+    row_tableau = np.hstack([B.T, np.eye(n), np.ones((n, 1))])
+    row_basis = list(range(m, m + n))
+    # Column tableau: constraints A y <= 1; columns are slacks (labels 0..m-1) then y (m..m+n-1)
+    col_tableau = np.hstack([np.eye(m), A, np.ones((m, 1))])
+    col_basis = list(range(m))
+
+    if initial_dropped_label < m:
+        tableaux = [(row_tableau, row_basis), (col_tableau, col_basis)]
+    else:
+        tableaux = [(col_tableau, col_basis), (row_tableau, row_basis)]
+
+    entering = initial_dropped_label
+    for _ in range(max_pivots):
+        tableau, basis = tableaux[0]
+        leaving = _pivot(tableau, basis, entering)
+        if leaving == initial_dropped_label:
+            break
+        entering = leaving
+        tableaux.reverse()
+    else:
+        raise RuntimeError("Lemke-Howson did not converge")
+
+    x = _basis_values(row_tableau, row_basis, range(m))
+    y = _basis_values(col_tableau, col_basis, range(m, m + n))
+    return x / x.sum(), y / y.sum()
+
+
+def _pivot(tableau, basis, column):
+    """Pivot column into the basis using the minimum ratio test; return the leaving label."""
+    coefficients = tableau[:, column]
+    positive = coefficients > TOLERANCE
+    if not positive.any():
+        raise RuntimeError("Lemke-Howson hit an unbounded ray")
+    ratios = np.full(len(coefficients), np.inf)
+    ratios[positive] = tableau[positive, -1] / coefficients[positive]
+    row = int(np.argmin(ratios))
+
+    tableau[row] /= tableau[row, column]
+    others = np.arange(len(tableau)) != row
+    tableau[others] -= np.outer(tableau[others, column], tableau[row])
+
+    leaving = basis[row]
+    basis[row] = column
+    return leaving
+
+
+def _basis_values(tableau, basis, labels):
+    values = np.zeros(len(labels))
+    for row, label in enumerate(basis):
+        if label in labels:
+            values[label - labels[0]] = tableau[row, -1]
+    return values
+
+
+def solve_zero_sum(M, max_pivots=None):
+    """
+    Solve the zero-sum game where the row player receives M[i, j] by linear programming.
+
+    After shifting M to be positive, the column player's problem is
+    max sum(y) s.t. M y <= 1, y >= 0, which starts feasible at y = 0 and is
+    solved with a dense tableau simplex (Dantzig's rule, falling back to
+    Bland's rule to escape degenerate cycling). The row player's strategy is
+    read from the dual values of the final tableau.
+
+    Returns (x, y, value): optimal row and column mixed strategies and the game value.
+    """
+    M = np.asarray(M, dtype=float)
+    m, n = M.shape
+    shift = 1 - M.min()
+    max_pivots = max_pivots or 50 * (m + n)
+
+    tableau = np.zeros((m + 1, n + m + 1))
+    tableau[:m, :n] = M + shift
+    tableau[:m, n:n + m] = np.eye(m)
+    tableau[:m, -1] = 1
+    tableau[m, :n] = -1
+    basis = np.arange(n, n + m)
+
+    for pivots in range(max_pivots):
+        costs = tableau[m, :-1]
+        if pivots < max_pivots // 2:
+            column = int(np.argmin(costs))
+            if costs[column] >= -TOLERANCE:
+                break
+        else:
+            candidates = np.flatnonzero(costs < -TOLERANCE)
+            if not len(candidates):
+                break
+            column = int(candidates[0])
+
+        coefficients = tableau[:m, column]
+        positive = coefficients > TOLERANCE
+        ratios = np.full(m, np.inf)
+        ratios[positive] = tableau[:m, -1][positive] / coefficients[positive]
+        # Break ratio ties by the smallest basic label (Bland)
+        ties = np.flatnonzero(ratios <= ratios.min() + TOLERANCE)
+        row = int(ties[np.argmin(basis[ties])])
+
+        tableau[row] /= tableau[row, column]
+        others = np.arange(m + 1) != row
+        tableau[others] -= np.outer(tableau[others, column], tableau[row])
+        basis[row] = column
+    else:
+        raise RuntimeError("Simplex did not converge")
+
+    y = np.zeros(n)
+    in_basis = basis < n
+    y[basis[in_basis]] = tableau[:m, -1][in_basis]
+    x = np.clip(tableau[m, n:n + m], 0, None)
+
+    total = y.sum()
+    return x / x.sum(), y / total, 1 / total - shift
+
+
+def _unique_equilibria(equilibria, decimals=8):
+    unique = []
+    seen = set()
+    for x, y in equilibria:
+        key = (tuple(np.round(x, decimals)), tuple(np.round(y, decimals)))
+        if key not in seen:
+            seen.add(key)
+            unique.append((x, y))
+    return unique
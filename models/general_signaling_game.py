@@ -0,0 +1,186 @@
+from .core import GameModel
+from .equilibrium import solve_zero_sum
+import numpy as np
+
+# Largest number of sender x receiver profile pairs payoff_tensor() will build
+MAX_PROFILE_PAIRS = 2 ** 24
+# Largest number of sender profiles find_pbe() will enumerate
+MAX_SENDER_PROFILES = 10 ** 8
+
+TOLERANCE = 1e-9
+
+
+class GeneralSignalingGame(GameModel):
+    name = "General Signaling Game"
+    description = "A sender-receiver game with any number of types, signals and actions. The sender learns their type and sends a costly signal; the receiver sees only the signal and chooses an action."
+
+    def __init__(self, priors=(0.5, 0.5), sender_payoffs=((1, 0), (0, 1)), receiver_payoffs=((1, 0), (0, 1)),
+                 signal_costs=None):
+        """
+        priors: probability of each type, shape (types,)
+        sender_payoffs[t][a]: sender's payoff when of type t and the receiver takes action a
+        receiver_payoffs[t][a]: receiver's payoff for action a when the sender is of type t
+        signal_costs[t][m]: cost to a type-t sender of sending signal m
+            (shape (types, signals); default no costs and as many signals as types)
+        """
+        super().__init__({
+            'priors': priors,
+            'sender_payoffs': sender_payoffs,
+            'receiver_payoffs': receiver_payoffs,
+            'signal_costs': signal_costs
+        })
+        self.priors = np.asarray(priors, dtype=float)
+        self.sender_payoffs = np.asarray(sender_payoffs, dtype=float)
+        self.receiver_payoffs = np.asarray(receiver_payoffs, dtype=float)
+        num_types = len(self.priors)
+        if signal_costs is None:
+            signal_costs = np.zeros((num_types, num_types))
+        self.signal_costs = np.asarray(signal_costs, dtype=float)
+
+        self.num_types = num_types
+        self.num_signals = self.signal_costs.shape[1]
+        self.num_actions = self.receiver_payoffs.shape[1]
+        if self.sender_payoffs.shape != (num_types, self.num_actions) or self.receiver_payoffs.shape[0] != num_types:
+            raise ValueError("Payoff arrays must have shape (types, actions)")
+        if self.signal_costs.shape[0] != num_types:
+            raise ValueError("Signal costs must have shape (types, signals)")
+        if not np.isclose(self.priors.sum(), 1):
+            raise ValueError("Type priors must sum to 1")
+
+    def sender_profiles(self, start=0, stop=None):
+        """
+        Pure sender strategies as an index tensor of shape (profiles, types):
+        entry [s, t] is the signal sent by type t under strategy s
+        """
+        total = self.num_signals ** self.num_types
+        stop = total if stop is None else min(stop, total)
+        return np.stack(np.unravel_index(np.arange(start, stop), (self.num_signals,) * self.num_types), axis=1)
+
+    def receiver_profiles(self, start=0, stop=None):
+        """
+        Pure receiver strategies as an index tensor of shape (profiles, signals):
+        entry [r, m] is the action taken after signal m under strategy r
+        """
+        total = self.num_actions ** self.num_signals
+        stop = total if stop is None else min(stop, total)
+        return np.stack(np.unravel_index(np.arange(start, stop), (self.num_actions,) * self.num_signals), axis=1)
+
+    def profile_payoffs(self, sender_profiles, receiver_profiles):
+        """
+        Expected payoffs of every sender profile against every receiver profile,
+        shape (2, len(sender_profiles), len(receiver_profiles)), from one-hot
+        strategy tensors contracted with einsum
+        """
+        sends = np.eye(self.num_signals)[sender_profiles]       # (s, types, signals)
+        responds = np.eye(self.num_actions)[receiver_profiles]  # (r, signals, actions)
+
+        # Probability of each (type, action) under each profile pair, weighted by the prior
+        outcome = np.einsum('t,stm,rma->srta', self.priors, sends, responds, optimize=True)
+        sender = np.einsum('srta,ta->sr', outcome, self.sender_payoffs, optimize=True)
+        sender -= np.einsum('t,stm,tm->s', self.priors, sends, self.signal_costs)[:, None]
+        receiver = np.einsum('srta,ta->sr', outcome, self.receiver_payoffs, optimize=True)
+        return np.stack([sender, receiver])
+
+    def play(self, sender_strategy, receiver_strategy):
+        """Expected payoffs for one sender profile index and one receiver profile index"""
+        payoffs = self.profile_payoffs(self.sender_profiles(sender_strategy, sender_strategy + 1),
+                                       self.receiver_profiles(receiver_strategy, receiver_strategy + 1))
+        return float(payoffs[0, 0, 0]), float(payoffs[1, 0, 0])
+
+    def payoff_tensor(self):
+        pairs = self.num_signals ** self.num_types * self.num_actions ** self.num_signals
+        if pairs > MAX_PROFILE_PAIRS:
+            raise ValueError(f"{pairs} strategy profiles are too many for a payoff tensor; use find_pbe()")
+        return self.profile_payoffs(self.sender_profiles(), self.receiver_profiles())
+
+    def rationalizable_actions(self):
+        """
+        Which actions are a best response to at least one belief about the type.
+
+        Action a qualifies when the zero-sum game in which a belief (rows) plays
+        against an alternative action a' (columns), with payoff
+        u_R(t, a) - u_R(t, a'), has value 0.
+        """
+        supportable = np.zeros(self.num_actions, dtype=bool)
+        for a in range(self.num_actions):
+            advantage = self.receiver_payoffs[:, [a]] - self.receiver_payoffs
+            _, _, value = solve_zero_sum(advantage)
+            supportable[a] = value >= -1e-7
+        return supportable
+
+    def find_pbe(self, sender_profiles=None, block_size=65536):
+        """
+        Find pure-strategy perfect Bayesian equilibria.
+
+        Sender profiles are checked in vectorized blocks. For each one, the
+        receiver best-responds to the Bayesian posterior after every signal
+        that is sent, taking the lowest-index action on ties. For each unsent
+        signal it must have some action that is a best response to some
+        belief and that leaves no type wanting to send that signal. The
+        profile is an equilibrium when, in addition, no type gains by
+        switching to another signal that is sent.
+
+        sender_profiles: optional (profiles, types) candidates; by default all
+        num_signals ** num_types sender strategies are enumerated
+
+        Returns a list of dicts with the "sender" and "receiver" strategies,
+        expected "payoffs", the "off_path" signals and the equilibrium "kind"
+        ("separating", "pooling" or "partially pooling")
+        """
+        if sender_profiles is None:
+            total = self.num_signals ** self.num_types
+            if total > MAX_SENDER_PROFILES:
+                raise ValueError(f"{total} sender strategies are too many to enumerate; pass candidate sender_profiles")
+            blocks = (self.sender_profiles(start, start + block_size) for start in range(0, total, block_size))
+        else:
+            sender_profiles = np.asarray(sender_profiles)
+            blocks = (sender_profiles[start:start + block_size] for start in range(0, len(sender_profiles), block_size))
+
+        supportable = self.rationalizable_actions()
+        types = np.arange(self.num_types)
+        equilibria = []
+        for profiles in blocks:
+            sends = np.eye(self.num_signals, dtype=bool)[profiles]  # (b, types, signals)
+            on_path = sends.any(axis=1)                             # (b, signals)
+
+            # Receiver's best response to the posterior after each sent signal
+            weights = sends * self.priors[None, :, None]
+            expected = np.einsum('btm,ta->bma', weights, self.receiver_payoffs)
+            actions = expected.argmax(axis=2)                       # (b, signals)
+
+            # Each type's equilibrium payoff
+            chosen_actions = np.take_along_axis(actions, profiles, axis=1)
+            equilibrium_payoff = self.sender_payoffs[types, chosen_actions] - self.signal_costs[types, profiles]
+
+            # No type may gain by sending another signal that is in use
+            deviation = self.sender_payoffs[types[None, :, None], actions[:, None, :]] - self.signal_costs[None]
+            on_path_ok = ~((deviation > equilibrium_payoff[:, :, None] + TOLERANCE) & on_path[:, None, :]).any(axis=(1, 2))
+
+            # An unsent signal needs a rationalizable action that deters every type
+            off_path_payoff = self.sender_payoffs.T[None, :, :] - self.signal_costs.T[:, None, :]  # (signals, actions, types)
+            deters = (off_path_payoff[None] <= equilibrium_payoff[:, None, None, :] + TOLERANCE).all(axis=3)
+            deters &= supportable[None, None, :]
+            off_path_ok = (deters.any(axis=2) | on_path).all(axis=1)
+
+            off_path_actions = deters.argmax(axis=2)
+            receivers = np.where(on_path, actions, off_path_actions)
+            for b in np.flatnonzero(on_path_ok & off_path_ok):
+                equilibria.append(self._describe_equilibrium(profiles[b], receivers[b], on_path[b]))
+        return equilibria
+
+    def _describe_equilibrium(self, sender, receiver, on_path):
+        payoffs = self.profile_payoffs(sender[None], receiver[None])[:, 0, 0]
+        distinct = len(np.unique(sender))
+        if distinct == self.num_types:
+            kind = "separating"
+        elif distinct == 1:
+            kind = "pooling"
+        else:
+            kind = "partially pooling"
+        return {
+            "sender": sender.copy(),
+            "receiver": receiver.copy(),
+            "payoffs": (float(payoffs[0]), float(payoffs[1])),
+            "off_path": np.flatnonzero(~on_path),
+            "kind": kind
+        }
@@ -1,10 +1,11 @@
-from .core import GameModel
+from .core import GameModel, bimatrix
 
 class HawkDoveGame(GameModel):
     name = "Hawk-Dove Game"
     description = "A classic conflict model examining aggressive vs. passive behavior, also known as Chicken Game. Players can be aggressive (Hawk) or passive (Dove), with different outcomes depending on their choices."
     row_labels = ["Hawk", "Dove"]
     col_labels = ["Hawk", "Dove"]
+    vectorized_params = True
 
     def __init__(self, value=4, cost=6):
         super().__init__({'value': value, 'cost': cost})
@@ -25,3 +26,8 @@ class HawkDoveGame(GameModel):
         else:  # Both Dove
             # Both share the value peacefully
             return value/2, value/2
+
+    def payoff_tensor(self):
+        value, cost = self.params['value'], self.params['cost']
+        return bimatrix([[(value - cost)/2, value], [0, value/2]],
+                        [[(value - cost)/2, 0], [value, value/2]])
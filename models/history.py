@@ -0,0 +1,115 @@
+import os
+import numpy as np
+
+
+class MoveHistory:
+    """
+    Append-only store of binary moves (0 = Cooperate, 1 = Betray), one bit per move.
+
+    Moves are packed eight to a byte in a NumPy uint8 buffer, or in a
+    memory-mapped file when a path is given, so a million-round match takes
+    125 KB per player instead of a list of Python ints. Indexing and slicing
+    only unpack the bytes they touch.
+
+    Parameters:
+    - capacity: expected number of moves (the buffer grows if exceeded)
+    - path: optional file to memory-map the bits into
+    """
+
+    def __init__(self, capacity=0, path=None):
+        self.path = path
+        self._length = 0
+        if path is not None:
+            # Start from an empty file so stale bits are never read back
+            open(path, 'wb').close()
+        self._buffer = self._allocate(max(1, (capacity + 7) // 8))
+
+    def _allocate(self, nbytes, old=None):
+        if self.path is None:
+            buffer = np.zeros(nbytes, dtype=np.uint8)
+            if old is not None:
+                buffer[:len(old)] = old
+            return buffer
+        if old is not None:
+            old.flush()
+            del old
+        # Extending the file zero-fills the new bytes
+        with open(self.path, 'ab') as f:
+            f.truncate(nbytes)
+        return np.memmap(self.path, dtype=np.uint8, mode='r+', shape=(nbytes,))
+
+    def _reserve(self, length):
+        if (length + 7) // 8 > len(self._buffer):
+            self._buffer = self._allocate(max((length + 7) // 8, 2 * len(self._buffer)), self._buffer)
+
+    def append(self, move):
+        """Append one move."""
+        self._reserve(self._length + 1)
+        if move:
+            self._buffer[self._length >> 3] |= 0x80 >> (self._length & 7)
+        self._length += 1
+
+    def extend(self, moves):
+        """Append an array of moves, packing whole bytes at a time."""
+        moves = np.asarray(moves, dtype=np.uint8)
+        self._reserve(self._length + len(moves))
+        # Fill the partially used last byte one bit at a time, then pack the rest
+        head = min(len(moves), (-self._length) % 8)
+        for move in moves[:head]:
+            self.append(move)
+        packed = np.packbits(moves[head:])
+        start = self._length >> 3
+        self._buffer[start:start + len(packed)] = packed
+        self._length += len(moves) - head
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step < 0:
+                return self[:][index]
+            if start >= stop:
+                return np.zeros(0, dtype=np.uint8)
+            bits = np.unpackbits(self._buffer[start >> 3:(stop + 7) >> 3])
+            offset = start & 7
+            return bits[offset:offset + stop - start][::step]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("MoveHistory index out of range")
+        return int(self._buffer[index >> 3] >> (7 - (index & 7)) & 1)
+
+    def __iter__(self, chunk_size=65536):
+        for start in range(0, self._length, chunk_size):
+            yield from self[start:start + chunk_size].tolist()
+
+    def page(self, page, page_size=50):
+        """Moves on one page of a paginated view, as an array."""
+        return self[page * page_size:(page + 1) * page_size]
+
+    def tolist(self):
+        return self[:].tolist()
+
+    @property
+    def nbytes(self):
+        return (self._length + 7) // 8
+
+    def flush(self):
+        """Write a memory-mapped history to disk."""
+        if isinstance(self._buffer, np.memmap):
+            self._buffer.flush()
+
+    @classmethod
+    def open(cls, path, length):
+        """Reopen a memory-mapped history of the given length read-only."""
+        history = cls.__new__(cls)
+        history.path = path
+        history._length = length
+        size = os.path.getsize(path)
+        history._buffer = np.memmap(path, dtype=np.uint8, mode='r', shape=(size,)) if size else np.zeros(1, dtype=np.uint8)
+        return history
+
+    def __repr__(self):
+        return f"MoveHistory(length={self._length}, nbytes={self.nbytes})"
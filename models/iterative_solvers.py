@@ -0,0 +1,231 @@
+import numpy as np
+from .colonel_blotto_game import ColonelBlottoGame
+
+
+class MatrixOracle:
+    """
+    Payoff oracle for a game given by explicit payoff matrices.
+
+    Player 0 picks rows of A, player 1 picks columns of B.
+    """
+
+    def __init__(self, A, B):
+        self.A = np.asarray(A, dtype=float)
+        self.B = np.asarray(B, dtype=float)
+        self.num_actions = self.A.shape
+
+    def action_values(self, player, opponent_mix):
+        """Expected payoff of each of the player's actions against the opponent's mixed strategy."""
+        return self.A @ opponent_mix if player == 0 else opponent_mix @ self.B
+
+    def best_response(self, player, opponent_mix):
+        """Return (action index, value) of a best response."""
+        values = self.action_values(player, opponent_mix)
+        action = int(np.argmax(values))
+        return action, float(values[action])
+
+
+class BlottoOracle:
+    """
+    Payoff oracle for the exact Colonel Blotto game that never builds the payoff matrix.
+
+    The payoff (battlefields won minus lost) is a sum over battlefields, so
+    against a mixed strategy it only depends on the opponent's per-battlefield
+    marginal distributions. Action values are then one gather per battlefield,
+    and best responses are a knapsack-style dynamic program over battlefields.
+    Both players share the same action set: every allocation of all resources.
+    """
+
+    def __init__(self, game):
+        self.resources = game.params['resources']
+        self.battlefields = game.params['battlefields']
+        self.allocations = game.enumerate_allocations()
+        self.num_actions = (len(self.allocations), len(self.allocations))
+        # Allocations are enumerated in lexicographic order, so their base-(resources+1) codes are sorted
+        self._place_values = (self.resources + 1) ** np.arange(self.battlefields - 1, -1, -1)
+        self._codes = self.allocations.astype(np.int64) @ self._place_values
+
+    def field_values(self, opponent_mix):
+        """
+        values[b, k]: expected payoff from battlefield b when placing k units there,
+        P(opponent places fewer) - P(opponent places more)
+        """
+        levels = self.resources + 1
+        values = np.empty((self.battlefields, levels))
+        for b in range(self.battlefields):
+            pmf = np.bincount(self.allocations[:, b], weights=opponent_mix, minlength=levels)
+            cdf = np.cumsum(pmf)
+            fewer = np.concatenate([[0.0], cdf[:-1]])
+            more = cdf[-1] - cdf
+            values[b] = fewer - more
+        return values
+
+    def action_values(self, player, opponent_mix):
+        values = self.field_values(opponent_mix)
+        return values[np.arange(self.battlefields), self.allocations].sum(axis=1)
+
+    def best_response(self, player, opponent_mix):
+        """Best allocation by dynamic programming over battlefields, O(battlefields * resources^2)."""
+        values = self.field_values(opponent_mix)
+        levels = self.resources + 1
+        units = np.arange(levels)
+        # spend[r, k]: k of the r remaining units go to the current battlefield
+        feasible = units[None, :] <= units[:, None]
+
+        best = values[-1].copy()  # Last battlefield takes everything that is left
+        choices = []
+        for b in range(self.battlefields - 2, -1, -1):
+            rest = np.where(feasible, best[np.clip(units[:, None] - units[None, :], 0, None)], -np.inf)
+            totals = values[b][None, :] + rest
+            choices.append(np.argmax(totals, axis=1))
+            best = totals.max(axis=1)
+
+        allocation = []
+        remaining = self.resources
+        for choice in reversed(choices):
+            allocation.append(int(choice[remaining]))
+            remaining -= allocation[-1]
+        allocation.append(remaining)
+
+        action = int(np.searchsorted(self._codes, np.dot(allocation, self._place_values)))
+        return action, float(best[self.resources])
+
+
+def oracle_for(model):
+    """Pick the payoff oracle for a GameModel."""
+    if isinstance(model, ColonelBlottoGame):
+        return BlottoOracle(model)
+    payoffs = model.payoff_tensor()
+    if payoffs.ndim != 3 or payoffs.shape[0] != 2:
+        raise ValueError("Iterative solvers need a two-player game")
+    return MatrixOracle(payoffs[0], payoffs[1])
+
+
+class IterativeSolver:
+    """
+    Approximate equilibria of large two-player games by repeated play.
+
+    Methods:
+    - "rm+": regret matching+ with linearly weighted averaging
+    - "fictitious_play": each player best-responds to the other's average
+      strategy; only needs best_response() from the oracle
+    - "mwu": multiplicative weights (Hedge) with the given learning rate
+
+    The state is a few arrays per player and can be saved with
+    save_checkpoint() and restored with IterativeSolver.load() to continue
+    a long run.
+    """
+
+    METHODS = ("rm+", "fictitious_play", "mwu")
+
+    def __init__(self, oracle, method="rm+", learning_rate=0.1):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method '{method}'")
+        self.oracle = oracle
+        self.method = method
+        self.learning_rate = learning_rate
+        self.iteration = 0
+        # Per player: cumulative regrets (rm+), best-response counts (fictitious play)
+        # or cumulative payoffs (mwu), plus the running sum of played strategies
+        self.accumulators = [np.zeros(n) for n in oracle.num_actions]
+        self.strategy_sums = [np.zeros(n) for n in oracle.num_actions]
+        self.history = []
+
+    def current_strategies(self):
+        """Strategies the players use in the next iteration."""
+        if self.method == "rm+":
+            return [_normalise(np.maximum(r, 0)) for r in self.accumulators]
+        if self.method == "mwu":
+            return [_normalise(np.exp(self.learning_rate * (c - c.max()))) for c in self.accumulators]
+        return self.average_strategies()
+
+    def average_strategies(self):
+        """Time-averaged strategies, which converge to equilibrium in zero-sum games."""
+        return [_normalise(s) for s in self.strategy_sums]
+
+    def step(self):
+        """Run one iteration for both players simultaneously."""
+        self.iteration += 1
+        x, y = self.current_strategies()
+
+        if self.method == "fictitious_play":
+            br1, _ = self.oracle.best_response(0, y)
+            br2, _ = self.oracle.best_response(1, x)
+            self.strategy_sums[0][br1] += 1
+            self.strategy_sums[1][br2] += 1
+            return
+
+        values1 = self.oracle.action_values(0, y)
+        values2 = self.oracle.action_values(1, x)
+        if self.method == "rm+":
+            # Clip cumulative regrets at zero after every update
+            self.accumulators[0] = np.maximum(self.accumulators[0] + values1 - x @ values1, 0)
+            self.accumulators[1] = np.maximum(self.accumulators[1] + values2 - y @ values2, 0)
+            weight = self.iteration
+        else:
+            self.accumulators[0] += values1
+            self.accumulators[1] += values2
+            weight = 1
+        self.strategy_sums[0] += weight * x
+        self.strategy_sums[1] += weight * y
+
+    def exploitability(self):
+        """
+        Total gain available to the players by best-responding to the average
+        strategies (NashConv); zero exactly at an equilibrium
+        """
+        x, y = self.average_strategies()
+        _, best1 = self.oracle.best_response(0, y)
+        _, best2 = self.oracle.best_response(1, x)
+        value1 = x @ self.oracle.action_values(0, y)
+        value2 = y @ self.oracle.action_values(1, x)
+        return float(best1 - value1 + best2 - value2)
+
+    def run(self, iterations, track_every=100, checkpoint_path=None, checkpoint_every=1000, tolerance=None):
+        """
+        Run iterations, recording (iteration, exploitability) every track_every
+        iterations and writing a checkpoint every checkpoint_every iterations.
+        Stops early once exploitability falls below tolerance.
+
+        Returns the list of recorded (iteration, exploitability) pairs.
+        """
+        for _ in range(iterations):
+            self.step()
+            if track_every and self.iteration % track_every == 0:
+                self.history.append((self.iteration, self.exploitability()))
+                if tolerance is not None and self.history[-1][1] < tolerance:
+                    break
+            if checkpoint_path and self.iteration % checkpoint_every == 0:
+                self.save_checkpoint(checkpoint_path)
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path)
+        return self.history
+
+    def save_checkpoint(self, path):
+        """Save the solver state in .npz format to exactly the given path."""
+        # Writing through a file handle stops np.savez from appending ".npz"
+        with open(path, 'wb') as f:
+            np.savez(f, method=self.method, learning_rate=self.learning_rate, iteration=self.iteration,
+                     accumulator1=self.accumulators[0], accumulator2=self.accumulators[1],
+                     strategy_sum1=self.strategy_sums[0], strategy_sum2=self.strategy_sums[1],
+                     history=np.array(self.history, dtype=float).reshape(-1, 2))
+
+    @classmethod
+    def load(cls, path, oracle):
+        """Restore a solver saved with save_checkpoint() to continue running it."""
+        with np.load(path) as data:
+            solver = cls(oracle, str(data['method']), float(data['learning_rate']))
+            if tuple(len(data[name]) for name in ('strategy_sum1', 'strategy_sum2')) != tuple(oracle.num_actions):
+                raise ValueError("Checkpoint does not match the oracle's action sets")
+            solver.iteration = int(data['iteration'])
+            solver.accumulators = [data['accumulator1'].copy(), data['accumulator2'].copy()]
+            solver.strategy_sums = [data['strategy_sum1'].copy(), data['strategy_sum2'].copy()]
+            solver.history = [(int(i), float(e)) for i, e in data['history']]
+        return solver
+
+
+def _normalise(weights):
+    total = weights.sum()
+    if total <= 0:
+        return np.full(len(weights), 1 / len(weights))
+    return weights / total
@@ -1,5 +1,15 @@
 import numpy as np
-import pandas as pd
+from .country_data import load_country_data
+from .life_table import MAX_AGE, SEXES, hazard_multiplier, load_life_table
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+# Largest number of samples drawn at once by calculate_batch_distribution()
+MAX_BLOCK_CELLS = 2 ** 22
+# Histogram sketch for population quantiles: 0.1-year bins from 0 to 120. The
+# cap bounds totals above but not below, so bins for negative totals are added
+# as lower values are seen
+SKETCH_BINS_PER_YEAR = 10
+SKETCH_EDGES = np.linspace(0, 120, 120 * SKETCH_BINS_PER_YEAR + 1)
 
 class LifeExpectancyCalculator:
     """
@@ -28,113 +38,333 @@ class LifeExpectancyCalculator:
         Returns:
         - Estimated life expectancy
         """
-        # Initialize region_factor to avoid UnboundLocalError
-        region_factor = 0  # Default value before extracting from country data
-
-        # Adjust base life expectancy to align with country-specific total life expectancy
-        base_life_expectancy = region_factor - 20  # Reduce base life expectancy further
-
-        # Comprehensive validation and cleanup
-        # Load country data with the correct delimiter
-        country_data = pd.read_csv("data/life/life2025.csv", sep='\s+')
-        country_data.columns = country_data.columns.str.strip().str.replace('"', '')
-
-        # Ensure 'Country' column exists
-        if 'Country' not in country_data.columns:
-            raise ValueError("The CSV file does not have a 'Country' column.")
-        country_data['Country'] = country_data['Country'].str.strip()
-
-        # Dynamically create 'LifeExpectancyAdjustment' column based on gender
-        if gender == "Male" and 'Males' in country_data.columns:
-            country_data['LifeExpectancyAdjustment'] = country_data['Males']
-        elif gender == "Female" and 'Females' in country_data.columns:
-            country_data['LifeExpectancyAdjustment'] = country_data['Females']
-        else:
-            raise ValueError("The CSV file does not have the required gender column to calculate 'LifeExpectancyAdjustment'.")
+        # Country data is parsed once and shared; lookups are by normalized name
+        country_data = load_country_data()
+        sex_life_expectancy = country_data.sex_life_expectancy(gender)
+        code = country_data.code(region)
 
-        # Dynamically create missing columns with default values or derived logic
-        if 'HealthcareQuality' not in country_data.columns:
-            country_data['HealthcareQuality'] = 50  # Default value for healthcare quality
-        if 'PollutionLevel' not in country_data.columns:
-            country_data['PollutionLevel'] = 30  # Default value for pollution level
-        if 'ObesityRate' not in country_data.columns:
-            country_data['ObesityRate'] = (
-                country_data['Females'] + country_data['Males']
-            ) / 2 * 0.1  # Example derived logic for obesity rate
+        # Adjustments based on chronic diseases and medical history
+        chronic_disease_factor = _chronic_disease_factor("diabetes" in medical_history,
+                                                         "hypertension" in medical_history,
+                                                         "heart_disease" in medical_history)
 
-        # Clean region input to match country names
-        region = region.strip()
+        estimated_life_expectancy = _estimate_life_expectancy(
+            age, income, smoking, drinking, exercise, height, weight, sex_life_expectancy[code],
+            country_data.healthcare_quality[code], country_data.pollution_level[code],
+            country_data.obesity_rate[code], chronic_disease_factor
+        )
 
-        # Match country data
-        country_row = country_data[country_data['Country'] == region]
+        # Introduce randomness with a normal distribution
+        random_factor = np.random.normal(loc=0, scale=5)  # Mean 0, standard deviation 5
+
+        remaining, total = _cap(age, estimated_life_expectancy + random_factor)
+        return {
+            "remaining_life_expectancy": float(remaining),
+            "total_life_expectancy": float(total)
+        }
 
-        if country_row.empty:
-            raise ValueError(f"Region '{region}' not found in the CSV file.")
+    @staticmethod
+    def calculate_batch(data=None, rng=None, **columns):
+        """
+        Estimate life expectancy for many individuals at once.
 
-        # Extract region-specific factors
-        region_factor = country_row.iloc[0]["LifeExpectancyAdjustment"]
-        healthcare_quality = country_row.iloc[0]["HealthcareQuality"]
-        pollution_level = country_row.iloc[0]["PollutionLevel"]
-        obesity_rate = country_row.iloc[0]["ObesityRate"]
+        Parameters:
+        - data: optional DataFrame or dict of columns
+        - rng: optional numpy Generator for the random factor (defaults to the
+          global np.random state, like calculate())
+        - columns: arrays overriding or completing data, named like the
+          arguments of calculate(): age, income, smoking, drinking, exercise,
+          region, height, weight, gender. Chronic diseases are given either as
+          boolean diabetes / hypertension / heart_disease columns or as a
+          medical_history column of lists. region_code (integer codes from
+          CountryData) may be given instead of region.
 
-        # Adjustments based on age
-        age_factor = max(0, (base_life_expectancy - age))
+        Every factor is computed with whole-array NumPy operations, and country
+        names are mapped to integer codes once per distinct name, so millions
+        of rows take well under a second.
 
-        # Adjustments based on smoking
-        smoking_factor = -10 * smoking  # Increase negative impact of smoking
+        Returns:
+        - dict with "remaining_life_expectancy" and "total_life_expectancy" arrays
+        """
+        ages, estimated_life_expectancy = _batch_estimates(data, columns)
+        random_factor = (np.random if rng is None else rng).normal(loc=0, scale=5, size=len(ages))
+        remaining, total = _cap(ages, estimated_life_expectancy + random_factor)
+        return {
+            "remaining_life_expectancy": remaining,
+            "total_life_expectancy": total
+        }
 
-        # Adjustments based on drinking
-        drinking_factor = -7 * drinking  # Increase negative impact of drinking
+    @staticmethod
+    def calculate_distribution(age, income, smoking, drinking, exercise, region, height, weight, gender,
+                               medical_history, samples=10000, percentiles=DEFAULT_PERCENTILES, seed=None):
+        """
+        Distribution of one person's total life expectancy over the random factor.
 
-        # Adjustments based on income
-        income_factor = (np.log(max(1, income)) - 10) * 0.5  # Further reduce positive impact of income
+        Takes the same arguments as calculate(), draws `samples` random
+        factors in one vectorized operation from a Generator seeded with
+        `seed`, and returns a dict with the "mean", "mean_remaining",
+        "percentiles" ({percentile: years}) and a "histogram" (counts, edges)
+        of total life expectancy over whole years up to 120, starting below 0
+        if any total is negative.
+        """
+        result = LifeExpectancyCalculator.calculate_batch_distribution(
+            age=[age], income=[income], smoking=[smoking], drinking=[drinking], exercise=[exercise],
+            region=[region], height=[height], weight=[weight], gender=[gender], medical_history=[medical_history],
+            samples=samples, percentiles=percentiles, seed=seed
+        )
+        return {
+            "mean": float(result["mean"][0]),
+            "mean_remaining": float(result["mean_remaining"][0]),
+            "percentiles": {q: float(value) for q, value in zip(percentiles, result["percentiles"][0])},
+            "histogram": result["histogram"]
+        }
 
-        # Adjustments based on exercise
-        exercise_factor = 2 * exercise  # Reduce positive impact of exercise
+    @staticmethod
+    def calculate_batch_distribution(data=None, samples=1000, percentiles=DEFAULT_PERCENTILES, seed=None,
+                                     max_block_cells=MAX_BLOCK_CELLS, **columns):
+        """
+        Monte Carlo distribution of total life expectancy for many individuals.
 
-        # Adjustments based on BMI
-        bmi = weight / ((height / 100) ** 2) if height > 0 else 0  # Calculate BMI
-        bmi_factor = -0.2 * (bmi - 22) ** 2  # Increase negative impact of BMI deviation
+        Inputs are given as for calculate_batch(). People are processed in
+        blocks of at most max_block_cells samples, and each block draws all
+        of its random factors in one call. Per-person statistics are exact for
+        that person's samples. Population-wide quantiles come from a
+        histogram sketch with 0.1-year bins that is accumulated block by
+        block. Bins of the same width are added below 0 as negative totals
+        are seen, so every sample is counted. Memory is therefore bounded
+        however many people or samples there are.
 
-        # Adjustments based on healthcare quality
-        healthcare_factor = healthcare_quality * 0.3  # Further reduce positive impact of healthcare quality
+        Returns a dict with per-person "mean", "mean_remaining" and
+        "percentiles" (people, len(percentiles)) arrays, plus population-wide
+        "population_percentiles" and "histogram" (counts over whole years,
+        edges) across all samples of all people, whose counts add up to
+        people * samples
+        """
+        rng = np.random.default_rng(seed)
+        ages, estimated_life_expectancy = _batch_estimates(data, columns)
+        people = len(ages)
+        block = max(1, max_block_cells // samples)
 
-        # Adjustments based on pollution level
-        pollution_factor = -pollution_level * 0.5  # Increase negative impact of pollution level
+        means = np.empty(people)
+        mean_remaining = np.empty(people)
+        person_percentiles = np.empty((people, len(percentiles)))
+        sketch = np.zeros(len(SKETCH_EDGES) - 1, dtype=np.int64)
+        # negative_sketch[k] counts totals in [-(k + 1) / SKETCH_BINS_PER_YEAR, -k / SKETCH_BINS_PER_YEAR)
+        negative_sketch = np.zeros(0, dtype=np.int64)
+        for start in range(0, people, block):
+            stop = min(start + block, people)
+            block_ages = ages[start:stop, None]
+            random_factor = rng.normal(loc=0, scale=5, size=(stop - start, samples))
+            remaining, total = _cap(block_ages, estimated_life_expectancy[start:stop, None] + random_factor)
+            means[start:stop] = total.mean(axis=1)
+            mean_remaining[start:stop] = remaining.mean(axis=1)
+            person_percentiles[start:stop] = np.percentile(total, percentiles, axis=1).T
+            sketch += np.histogram(total, SKETCH_EDGES)[0]
+            negative = total[total < 0]
+            if len(negative):
+                bins = np.bincount(np.ceil(-negative * SKETCH_BINS_PER_YEAR).astype(np.int64) - 1)
+                if len(bins) > len(negative_sketch):
+                    negative_sketch = np.pad(negative_sketch, (0, len(bins) - len(negative_sketch)))
+                negative_sketch[:len(bins)] += bins
 
-        # Adjustments based on obesity rate
-        obesity_factor = -obesity_rate * 0.4  # Increase negative impact of obesity rate
+        # Whole years of negative bins, lowest first, in front of the fixed ones
+        negative_years = -(-len(negative_sketch) // SKETCH_BINS_PER_YEAR)
+        negative_sketch = np.pad(negative_sketch, (0, negative_years * SKETCH_BINS_PER_YEAR - len(negative_sketch)))
+        sketch = np.concatenate([negative_sketch[::-1], sketch])
+        edges = np.concatenate([-negative_years + np.arange(negative_years * SKETCH_BINS_PER_YEAR) / SKETCH_BINS_PER_YEAR,
+                                SKETCH_EDGES])
+        yearly_counts = sketch.reshape(-1, SKETCH_BINS_PER_YEAR).sum(axis=1)
+        yearly_edges = edges[::SKETCH_BINS_PER_YEAR]
+        return {
+            "mean": means,
+            "mean_remaining": mean_remaining,
+            "percentiles": person_percentiles,
+            "population_percentiles": {q: _sketch_quantile(sketch, edges, q / 100) for q in percentiles},
+            "histogram": (yearly_counts, yearly_edges)
+        }
 
-        # Adjustments based on chronic diseases and medical history
-        chronic_disease_factor = 0
-        if "diabetes" in medical_history:
-            chronic_disease_factor -= 10
-        if "hypertension" in medical_history:
-            chronic_disease_factor -= 8
-        if "heart_disease" in medical_history:
-            chronic_disease_factor -= 15
-
-        # Adjustments based on gender
-        if gender == "Male":
-            base_life_expectancy += 0  # Neutral adjustment for males
-        elif gender == "Female":
-            base_life_expectancy += 3  # Slight positive adjustment for females
 
-        # Introduce randomness with a normal distribution
-        random_factor = np.random.normal(loc=0, scale=5)  # Mean 0, standard deviation 5
+    @staticmethod
+    def calculate_actuarial(age, income, smoking, drinking, exercise, region, height, weight, gender, medical_history):
+        """
+        Life expectancy from the Gompertz-Makeham life table of the person's
+        country and sex, with the lifestyle factors applied as a hazard
+        multiplier. Takes the same arguments as calculate() and involves no
+        randomness.
 
-        # Calculate final life expectancy with randomness
-        estimated_life_expectancy = (
-            age_factor + income_factor + smoking_factor + drinking_factor + 
-            exercise_factor + region_factor + bmi_factor + healthcare_factor + 
-            pollution_factor + obesity_factor + chronic_disease_factor + random_factor
+        Returns:
+        - dict with the remaining and total life expectancy, the "hazard_multiplier"
+          and "survival", the probability of being alive at each whole age
+          from the current one up to 120
+        """
+        result = LifeExpectancyCalculator.calculate_batch_actuarial(
+            age=[age], income=[income], smoking=[smoking], drinking=[drinking], exercise=[exercise],
+            region=[region], height=[height], weight=[weight], gender=[gender], medical_history=[medical_history]
         )
+        table = load_life_table()
+        sex = SEXES.index(gender)
+        multiplier = float(result["hazard_multiplier"][0])
+        code = table.country_data.code(region)
+        ages = np.arange(int(np.ceil(age)), MAX_AGE + 1)
+        hazard = table.cumulative_hazard(table.alphas[code, sex], ages) - table.cumulative_hazard(table.alphas[code, sex], age)
+        return {
+            "remaining_life_expectancy": float(result["remaining_life_expectancy"][0]),
+            "total_life_expectancy": float(result["total_life_expectancy"][0]),
+            "hazard_multiplier": multiplier,
+            "survival": dict(zip(ages.tolist(), np.exp(-multiplier * hazard).tolist()))
+        }
 
-        # Cap the total life expectancy to a maximum of 120 years
-        total_life_expectancy = min(120, age + estimated_life_expectancy)
+    @staticmethod
+    def calculate_batch_actuarial(data=None, **columns):
+        """
+        Life-table version of calculate_batch() for many individuals, with
+        inputs given the same way.
 
-        # Ensure the method returns both remaining and total life expectancy
+        Returns:
+        - dict with "remaining_life_expectancy", "total_life_expectancy" and
+          "hazard_multiplier" arrays
+        """
+        inputs, count = _batch_inputs(data, columns)
+        gender = inputs["gender"]
+        is_male = gender == "Male"
+        if not np.all(is_male | (gender == "Female")):
+            raise ValueError("The CSV file does not have the required gender column to calculate 'LifeExpectancyAdjustment'.")
+
+        height = inputs["height"]
+        bmi = np.where(height > 0, inputs["weight"] / (np.where(height > 0, height, 1) / 100) ** 2, 0)
+        multiplier = hazard_multiplier(inputs["smoking"], inputs["drinking"], inputs["exercise"], bmi, inputs["income"],
+                                       inputs["diabetes"], inputs["hypertension"], inputs["heart_disease"])
+        remaining = load_life_table().remaining_life_expectancy(inputs["region_code"], is_male, inputs["age"], multiplier)
         return {
-            "remaining_life_expectancy": max(0, total_life_expectancy - age),
-            "total_life_expectancy": total_life_expectancy
+            "remaining_life_expectancy": remaining,
+            "total_life_expectancy": inputs["age"] + remaining,
+            "hazard_multiplier": multiplier
         }
+
+def _batch_estimates(data, columns):
+    """Ages and remaining-years estimates before the random factor for calculate_batch() inputs."""
+    inputs, count = _batch_inputs(data, columns)
+    country_data = load_country_data()
+    codes = inputs["region_code"]
+    gender = inputs["gender"]
+    is_male = gender == "Male"
+    if not np.all(is_male | (gender == "Female")):
+        raise ValueError("The CSV file does not have the required gender column to calculate 'LifeExpectancyAdjustment'.")
+
+    chronic_disease_factor = _chronic_disease_factor(inputs["diabetes"], inputs["hypertension"],
+                                                     inputs["heart_disease"])
+    estimated_life_expectancy = _estimate_life_expectancy(
+        inputs["age"], inputs["income"], inputs["smoking"], inputs["drinking"], inputs["exercise"],
+        inputs["height"], inputs["weight"],
+        np.where(is_male, country_data.males[codes], country_data.females[codes]),
+        country_data.healthcare_quality[codes], country_data.pollution_level[codes],
+        country_data.obesity_rate[codes], chronic_disease_factor
+    )
+    return inputs["age"], estimated_life_expectancy
+
+
+def _sketch_quantile(counts, edges, q):
+    """Quantile q in [0, 1] of the values summarised by a histogram, interpolated within a bin."""
+    cumulative = np.cumsum(counts)
+    if cumulative[-1] == 0:
+        return float('nan')
+    target = q * cumulative[-1]
+    index = min(int(np.searchsorted(cumulative, target)), len(counts) - 1)
+    below = cumulative[index - 1] if index else 0
+    fraction = (target - below) / counts[index] if counts[index] else 0.0
+    return float(edges[index] + fraction * (edges[index + 1] - edges[index]))
+
+
+BATCH_COLUMNS = ("age", "income", "smoking", "drinking", "exercise", "height", "weight")
+DISEASES = ("diabetes", "hypertension", "heart_disease")
+
+
+def _batch_inputs(data, columns):
+    """Collect calculate_batch() inputs as equal-length arrays, with regions as integer codes."""
+    source = {} if data is None else {name: data[name] for name in data.keys()}
+    source.update(columns)
+
+    missing = [name for name in BATCH_COLUMNS + ("gender",) if name not in source]
+    if "region" not in source and "region_code" not in source:
+        missing.append("region")
+    if missing:
+        raise ValueError(f"Missing input columns: {', '.join(missing)}")
+
+    inputs = {name: np.asarray(source[name], dtype=float) for name in BATCH_COLUMNS}
+    inputs["gender"] = np.asarray(source["gender"], dtype=object)
+    if "region_code" in source:
+        inputs["region_code"] = np.asarray(source["region_code"], dtype=np.intp)
+    else:
+        inputs["region_code"] = load_country_data().codes(source["region"])
+
+    count = len(inputs["age"])
+    if "medical_history" in source and not any(disease in source for disease in DISEASES):
+        history = list(source["medical_history"])
+        for disease in DISEASES:
+            inputs[disease] = np.fromiter((disease in entry for entry in history), dtype=bool, count=len(history))
+    else:
+        for disease in DISEASES:
+            inputs[disease] = np.asarray(source.get(disease, np.zeros(count, dtype=bool)), dtype=bool)
+
+    if any(len(values) != count for values in inputs.values()):
+        raise ValueError("All input columns must have the same length")
+    return inputs, count
+
+
+def _chronic_disease_factor(diabetes, hypertension, heart_disease):
+    """Penalty for chronic diseases, from boolean flags or arrays of flags."""
+    return -10 * np.asarray(diabetes) - 8 * np.asarray(hypertension) - 15 * np.asarray(heart_disease)
+
+
+def _estimate_life_expectancy(age, income, smoking, drinking, exercise, height, weight, region_factor,
+                              healthcare_quality, pollution_level, obesity_rate, chronic_disease_factor):
+    """
+    Remaining-years estimate before the random factor, shared by calculate()
+    and calculate_batch(); works on scalars and arrays alike
+    """
+    # The base is set before the country's figure is looked up, so it is -20
+    # for everyone, and the gender adjustment that used to follow the age
+    # factor never reached the estimate
+    base_life_expectancy = -20
+
+    # Adjustments based on age
+    age_factor = np.maximum(0, base_life_expectancy - age)
+
+    # Adjustments based on smoking
+    smoking_factor = -10 * smoking  # Increase negative impact of smoking
+
+    # Adjustments based on drinking
+    drinking_factor = -7 * drinking  # Increase negative impact of drinking
+
+    # Adjustments based on income
+    income_factor = (np.log(np.maximum(1, income)) - 10) * 0.5  # Further reduce positive impact of income
+
+    # Adjustments based on exercise
+    exercise_factor = 2 * exercise  # Reduce positive impact of exercise
+
+    # Adjustments based on BMI
+    height = np.asarray(height, dtype=float)
+    safe_height = np.where(height > 0, height, 1)
+    bmi = np.where(height > 0, weight / ((safe_height / 100) ** 2), 0)  # Calculate BMI
+    bmi_factor = -0.2 * (bmi - 22) ** 2  # Increase negative impact of BMI deviation
+
+    # Adjustments based on healthcare quality
+    healthcare_factor = healthcare_quality * 0.3  # Further reduce positive impact of healthcare quality
+
+    # Adjustments based on pollution level
+    pollution_factor = -pollution_level * 0.5  # Increase negative impact of pollution level
+
+    # Adjustments based on obesity rate
+    obesity_factor = -obesity_rate * 0.4  # Increase negative impact of obesity rate
+
+    return (
+        age_factor + income_factor + smoking_factor + drinking_factor +
+        exercise_factor + region_factor + bmi_factor + healthcare_factor +
+        pollution_factor + obesity_factor + chronic_disease_factor
+    )
+
+
+def _cap(age, estimated_life_expectancy):
+    """Cap the total life expectancy at 120 years; returns (remaining, total)."""
+    total_life_expectancy = np.minimum(120, age + estimated_life_expectancy)
+    return np.maximum(0, total_life_expectancy - age), total_life_expectancy
@@ -0,0 +1,175 @@
+from functools import lru_cache
+import numpy as np
+from .country_data import DEFAULT_PATH, load_country_data
+
+MAX_AGE = 120
+# Gompertz slope (ageing rate) and Makeham background hazard shared by all
+# countries; only the Gompertz level alpha is fitted per country and sex
+GOMPERTZ_BETA = 0.085
+MAKEHAM_LAMBDA = 0.0005
+# Largest number of (person, age) cells evaluated at once
+MAX_BLOCK_CELLS = 2 ** 22
+# Number of multiplier sets whose tables are kept in memory, and the most
+# distinct multipliers served from one set
+TABLE_CACHE_SIZE = 8
+MAX_TABLE_PROFILES = 8
+# Simpson points per person in remaining_life_expectancy() and the tables
+TABLE_POINTS = 121
+
+# Hazard ratios by level 0 / 1 / 2 (never / occasionally / regularly)
+SMOKING_HAZARD = np.array([1.0, 1.4, 2.2])
+DRINKING_HAZARD = np.array([1.0, 1.1, 1.4])
+EXERCISE_HAZARD = np.array([1.0, 0.85, 0.7])
+DISEASE_HAZARD = {"diabetes": 1.8, "hypertension": 1.5, "heart_disease": 2.0}
+
+SEXES = ("Female", "Male")
+
+
+def hazard_multiplier(smoking=0, drinking=0, exercise=0, bmi=22.0, income=50000, diabetes=False,
+                      hypertension=False, heart_disease=False):
+    """
+    Proportional hazard multiplier for a risk profile; all arguments may be arrays.
+
+    Levels are 0 / 1 / 2 as in LifeExpectancyCalculator.calculate(). The
+    BMI term grows with the squared distance from 22. Income lowers the
+    hazard by 10% per e-fold above $50,000, limited to between 0.7 and 1.5.
+    """
+    def level(values):
+        return np.clip(np.asarray(values).astype(int), 0, 2)
+
+    bmi = np.asarray(bmi, dtype=float)
+    income_ratio = np.exp(-0.1 * (np.log(np.maximum(1, income)) - np.log(50000)))
+    multiplier = (SMOKING_HAZARD[level(smoking)] * DRINKING_HAZARD[level(drinking)] * EXERCISE_HAZARD[level(exercise)]
+                  * np.where(bmi > 0, 1 + 0.004 * (bmi - 22) ** 2, 1.0)
+                  * np.clip(income_ratio, 0.7, 1.5))
+    for disease, flags in (("diabetes", diabetes), ("hypertension", hypertension), ("heart_disease", heart_disease)):
+        multiplier = multiplier * np.where(flags, DISEASE_HAZARD[disease], 1.0)
+    return multiplier
+
+
+class LifeTable:
+    """
+    Gompertz-Makeham life tables for every country and sex.
+
+    The hazard at age x is m * (lambda + alpha * exp(beta * x)), with beta and
+    lambda shared and alpha fitted so that life expectancy at birth matches
+    the country's Females / Males figure. A risk profile scales the hazard by
+    its multiplier m, so its survival curve is the baseline curve to the
+    power m.
+
+    The alphas for all countries and sexes are fitted together by
+    vectorized bisection on an age grid with spacing `step` up to MAX_AGE.
+    Tables for several risk profiles at whole ages come from one broadcast
+    over (countries, sexes, profiles, ages) and are cached per set of
+    multipliers, keeping the TABLE_CACHE_SIZE most recently used sets.
+    remaining_life_expectancy() reads from them when it can.
+    """
+
+    def __init__(self, country_data, beta=GOMPERTZ_BETA, makeham=MAKEHAM_LAMBDA, step=0.25):
+        self.country_data = country_data
+        self.beta = beta
+        self.makeham = makeham
+        self.step = step
+        self.ages = np.linspace(0, MAX_AGE, int(round(MAX_AGE / step)) + 1)
+        # Life expectancy at birth, shape (countries, 2) with sexes ordered as SEXES
+        self.targets = np.stack([country_data.females, country_data.males], axis=1)
+        self.alphas = self._fit(self.targets)
+        self._cached_tables = lru_cache(maxsize=TABLE_CACHE_SIZE)(self._compute_tables)
+
+    def cumulative_hazard(self, alphas, ages):
+        """Baseline cumulative hazard H(x) = lambda x + alpha / beta (exp(beta x) - 1), broadcast over both arguments."""
+        alphas = np.asarray(alphas)[..., None]
+        return self.makeham * ages + alphas / self.beta * np.expm1(self.beta * ages)
+
+    def _tail_integrals(self, survival):
+        """Integral of survival from each grid age to MAX_AGE, by the trapezoid rule along the last axis."""
+        pieces = (survival[..., 1:] + survival[..., :-1]) * self.step / 2
+        tail = np.zeros_like(survival)
+        tail[..., :-1] = np.cumsum(pieces[..., ::-1], axis=-1)[..., ::-1]
+        return tail
+
+    def _fit(self, targets, iterations=80):
+        """Alpha for every target life expectancy at birth, by bisection on log(alpha)."""
+        low = np.full(targets.shape, np.log(1e-10))
+        high = np.full(targets.shape, np.log(1.0))
+        for _ in range(iterations):
+            middle = (low + high) / 2
+            survival = np.exp(-self.cumulative_hazard(np.exp(middle), self.ages))
+            life_expectancy = self._tail_integrals(survival)[..., 0]
+            # A larger alpha means a higher hazard and a shorter life
+            too_long = life_expectancy > targets
+            low = np.where(too_long, middle, low)
+            high = np.where(too_long, high, middle)
+        return np.exp((low + high) / 2)
+
+    def _profile_tables(self, multipliers):
+        return self._cached_tables(tuple(float(m) for m in np.atleast_1d(multipliers)))
+
+    def _compute_tables(self, multipliers):
+        multipliers = np.asarray(multipliers)
+        years = np.arange(MAX_AGE + 1)
+        hazard = self.cumulative_hazard(self.alphas, years)                       # (countries, 2, years)
+        survival = np.exp(-multipliers[:, None] * hazard[:, :, None, :])
+        codes, sexes, profiles, ages = np.indices(survival.shape)
+        remaining = self._integrate(codes.ravel(), sexes.ravel().astype(bool), ages.ravel().astype(float),
+                                    multipliers[profiles.ravel()]).reshape(survival.shape)
+        return survival, remaining
+
+    def survival_curves(self, multipliers=(1.0,)):
+        """Probability of surviving from birth to each age 0..MAX_AGE, shape (countries, 2, profiles, MAX_AGE + 1)."""
+        return self._profile_tables(multipliers)[0]
+
+    def remaining_life_expectancy_table(self, multipliers=(1.0,)):
+        """Expected remaining years at each age 0..MAX_AGE, shape (countries, 2, profiles, MAX_AGE + 1)."""
+        return self._profile_tables(multipliers)[1]
+
+    def remaining_life_expectancy(self, codes, is_male, ages, multipliers, points=TABLE_POINTS):
+        """
+        Conditional remaining life expectancy for individuals, given country
+        codes, sex, exact ages and hazard multipliers as arrays.
+
+        When every age is a whole number of years and there are at most
+        MAX_TABLE_PROFILES distinct multipliers, as for the app or a batch of
+        discrete lifestyle profiles, the values are looked up in the cached
+        tables. Otherwise each person's survival from their own age,
+        exp(-m (H(t) - H(age))), is integrated up to MAX_AGE with Simpson's
+        rule on `points` points, so no interpolation in age is needed. The
+        tables are built with the same rule, so both paths agree.
+        """
+        codes, is_male, ages, multipliers = (a.ravel() for a in np.broadcast_arrays(
+            np.asarray(codes), np.asarray(is_male, dtype=bool), np.asarray(ages, dtype=float),
+            np.asarray(multipliers, dtype=float)))
+        if points == TABLE_POINTS and np.all((ages >= 0) & (ages == np.round(ages))):
+            profiles, profile_index = np.unique(multipliers, return_inverse=True)
+            if len(profiles) <= MAX_TABLE_PROFILES:
+                table = self.remaining_life_expectancy_table(profiles)
+                return table[codes, is_male.astype(int), profile_index, np.minimum(ages, MAX_AGE).astype(int)]
+        return self._integrate(codes, is_male, ages, multipliers, points)
+
+    def _integrate(self, codes, is_male, ages, multipliers, points=TABLE_POINTS):
+        """Simpson's rule behind remaining_life_expectancy(), in blocks of people so memory stays bounded."""
+        points += 1 - points % 2  # Simpson's rule needs an odd number of points
+        weights = np.ones(points)
+        weights[1:-1:2] = 4
+        weights[2:-1:2] = 2
+        fractions = np.linspace(0, 1, points)
+
+        result = np.empty(len(codes))
+        block = max(1, MAX_BLOCK_CELLS // points)
+        for start in range(0, len(codes), block):
+            stop = min(start + block, len(codes))
+            age = ages[start:stop]
+            multiplier = multipliers[start:stop, None]
+            alpha = self.alphas[codes[start:stop], is_male[start:stop].astype(int)]
+            span = np.clip(MAX_AGE - age, 0, None)
+            elapsed = span[:, None] * fractions
+            # H(age + elapsed) - H(age)
+            hazard = self.makeham * elapsed + (alpha * np.exp(self.beta * age) / self.beta)[:, None] * np.expm1(self.beta * elapsed)
+            result[start:stop] = np.exp(-multiplier * hazard) @ weights * span / (3 * (points - 1))
+        return result
+
+
+@lru_cache(maxsize=None)
+def load_life_table(path=DEFAULT_PATH, beta=GOMPERTZ_BETA, makeham=MAKEHAM_LAMBDA, step=0.25):
+    """Shared LifeTable for a country data file, fitted on first use."""
+    return LifeTable(load_country_data(path), beta, makeham, step)
@@ -1,10 +1,11 @@
-from .core import GameModel
+from .core import GameModel, bimatrix
 
 class PrisonersDilemma(GameModel):
     name = "Prisoner's Dilemma"
     description = "A classic non-zero-sum game model where two prisoners choose to cooperate or betray."
     row_labels = ["Cooperate", "Betray"]
     col_labels = ["Cooperate", "Betray"]
+    vectorized_params = True
 
     def __init__(self, R=3, T=5, S=0, P=1):
         super().__init__({'R': R, 'T': T, 'S': S, 'P': P})
@@ -20,3 +21,8 @@ class PrisonersDilemma(GameModel):
             return S, T
         else:
             return T, S
+
+    def payoff_tensor(self):
+        R, T, S, P = self.params['R'], self.params['T'], self.params['S'], self.params['P']
+        return bimatrix([[R, S], [T, P]],
+                        [[R, T], [S, P]])
@@ -15,18 +15,140 @@ class PublicGoodsGame(GameModel):
         num_players = self.params['num_players']
         
         # Validate contributions
-        contributions = np.clip(contributions, 0, endowment)
+        contributions = np.clip(np.asarray(contributions, dtype=float), 0, endowment)
         
         # Calculate total contribution and return for each player
-        total_contribution = sum(contributions)
-        public_good = total_contribution * multiplier
-        individual_return = public_good / num_players
+        individual_return = contributions.sum() * multiplier / num_players
         
         # Calculate final payoffs
-        payoffs = [endowment - contrib + individual_return for contrib in contributions]
+        return (endowment - contributions + individual_return).tolist()
+    
+    def play_groups(self, contributions, group_sizes=None):
+        """
+        Play many groups at once
+        
+        contributions: either a (groups, num_players) array with one row per
+            group, or a flat array of all players' contributions, group after
+            group, together with group_sizes
+        group_sizes: number of players in each group, for ragged groups
+        
+        The public good of each group is shared among that group's members.
+        Returns payoffs with the same shape as contributions.
+        """
+        endowment = self.params['endowment']
+        multiplier = self.params['multiplier']
+        contributions = np.clip(np.asarray(contributions, dtype=float), 0, endowment)
+        
+        if group_sizes is None:
+            if contributions.ndim != 2:
+                raise ValueError("Pass a (groups, players) array or flat contributions with group_sizes")
+            # Full groups share the pot among num_players, as in play()
+            if contributions.shape[1] != self.params['num_players']:
+                raise ValueError("Each row must hold num_players contributions; use group_sizes for other group sizes")
+            individual_return = contributions.sum(axis=1, keepdims=True) * multiplier / contributions.shape[1]
+            return endowment - contributions + individual_return
+        
+        group_sizes = np.asarray(group_sizes)
+        if contributions.ndim != 1 or group_sizes.sum() != len(contributions):
+            raise ValueError("group_sizes must add up to the number of contributions")
+        if np.any(group_sizes < 1):
+            raise ValueError("Every group needs at least one player")
+        starts = np.concatenate([[0], np.cumsum(group_sizes)[:-1]])
+        individual_return = np.add.reduceat(contributions, starts) * multiplier / group_sizes
+        return endowment - contributions + np.repeat(individual_return, group_sizes)
+        
+    def simulate_rounds(self, n_agents=100000, rounds=1000, free_rider_share=0.2, cooperator_share=0.2,
+                        punisher_share=0.3, punishment_cost=1.0, punishment_fine=3.0, tolerance=0.0,
+                        belief_weight=0.3, initial_belief=0.5, contribution_noise=0.0, rematch_every=1,
+                        imitation_rate=0.0, selection_strength=1.0, record_every=1, seed=None):
+        """
+        Repeated public goods rounds in a large population with peer punishment
+        
+        Agents are free riders (always contribute 0), unconditional cooperators
+        (always contribute the endowment) or conditional cooperators, who
+        contribute what they believe the others in their group will contribute.
+        After each round a conditional cooperator moves their belief towards
+        what their group-mates actually gave, by belief_weight.
+        
+        Punishers pay punishment_cost to fine every group-mate who contributed
+        more than `tolerance` less than they did, and each such fine costs the
+        target punishment_fine. Groups of num_players are re-drawn at random
+        every rematch_every rounds (0 keeps fixed partners). If imitation_rate
+        is set, that share of agents compare their round payoff with a random
+        other agent and copy their type and punisher trait with the Fermi
+        probability 1 / (1 + exp(-s * payoff difference / endowment)).
+        
+        Agent state is kept in arrays and every round is computed for all
+        groups at once, with a (groups, players, players) punishment matrix.
         
-        return payoffs
+        Yields a summary dict every record_every rounds, so memory does not
+        grow with the number of rounds
+        """
+        endowment = self.params['endowment']
+        group_size = self.params['num_players']
+        if n_agents % group_size:
+            raise ValueError("n_agents must be a multiple of num_players")
+        if free_rider_share + cooperator_share > 1:
+            raise ValueError("Free rider and cooperator shares must add up to at most 1")
+        rng = np.random.default_rng(seed)
+        groups = n_agents // group_size
+        
+        # 0 = free rider, 1 = unconditional cooperator, 2 = conditional cooperator
+        draws = rng.random(n_agents)
+        kinds = np.where(draws < free_rider_share, 0, np.where(draws < free_rider_share + cooperator_share, 1, 2)).astype(np.int8)
+        punishers = rng.random(n_agents) < punisher_share
+        beliefs = np.full(n_agents, initial_belief, dtype=np.float32)
+        members = rng.permutation(n_agents).reshape(groups, group_size)
         
+        for round_number in range(1, rounds + 1):
+            if rematch_every and round_number > 1 and (round_number - 1) % rematch_every == 0:
+                members = rng.permutation(n_agents).reshape(groups, group_size)
+            
+            contributions = np.select([kinds == 0, kinds == 1], [0.0, endowment], beliefs * endowment)
+            if contribution_noise:
+                contributions = contributions + rng.normal(0, contribution_noise * endowment, n_agents)
+            contributions = np.clip(contributions, 0, endowment)
+            
+            group_contributions = contributions[members]
+            payoffs = self.play_groups(group_contributions)
+            
+            # punishes[g, i, j]: member i of group g punishes member j
+            punishes = (punishers[members][:, :, None]
+                        & (group_contributions[:, None, :] < group_contributions[:, :, None] - tolerance))
+            punishments_given = punishes.sum(axis=2)
+            punishments_received = punishes.sum(axis=1)
+            payoffs = payoffs - punishment_cost * punishments_given - punishment_fine * punishments_received
+            
+            # Conditional cooperators update beliefs about the others' contributions
+            others_mean = (group_contributions.sum(axis=1, keepdims=True) - group_contributions) / (group_size - 1) \
+                if group_size > 1 else group_contributions
+            agent_payoffs = np.empty(n_agents)
+            agent_payoffs[members] = payoffs
+            others = np.empty(n_agents)
+            others[members] = others_mean / endowment
+            conditional = kinds == 2
+            beliefs[conditional] += belief_weight * (others[conditional] - beliefs[conditional])
+            
+            if imitation_rate:
+                learners = np.flatnonzero(rng.random(n_agents) < imitation_rate)
+                models = rng.integers(0, n_agents, len(learners))
+                # 1 / (1 + exp(-s * difference)) written with tanh so large differences cannot overflow
+                adopt_probability = 0.5 * (1 + np.tanh(selection_strength * (agent_payoffs[models] - agent_payoffs[learners]) / endowment / 2))
+                adopt = rng.random(len(learners)) < adopt_probability
+                kinds[learners[adopt]] = kinds[models[adopt]]
+                punishers[learners[adopt]] = punishers[models[adopt]]
+            
+            if round_number % record_every == 0:
+                yield {
+                    "round": round_number,
+                    "mean_contribution": float(contributions.mean() / endowment),
+                    "mean_payoff": float(agent_payoffs.mean()),
+                    "kind_shares": np.bincount(kinds, minlength=3) / n_agents,
+                    "punisher_share": float(punishers.mean()),
+                    "punishments_per_agent": float(punishments_given.sum() / n_agents),
+                    "mean_belief": float(beliefs[conditional].mean()) if conditional.any() else float('nan')
+                }
+    
     def play_two_player(self, contrib1, contrib2):
         # Simplified version for two players in the web interface
         endowment = self.params['endowment']
@@ -46,3 +168,31 @@ class PublicGoodsGame(GameModel):
         payoff2 = endowment - contrib2 + individual_return
         
         return payoff1, payoff2
+
+    def play_batch(self, contrib1, contrib2):
+        """
+        Vectorized play_two_player() over arrays of contributions.
+
+        Returns (payoffs1, payoffs2) arrays.
+        """
+        endowment = self.params['endowment']
+        multiplier = self.params['multiplier']
+
+        contrib1 = np.clip(contrib1, 0, endowment)
+        contrib2 = np.clip(contrib2, 0, endowment)
+
+        individual_return = (contrib1 + contrib2) * multiplier / 2
+        return endowment - contrib1 + individual_return, endowment - contrib2 + individual_return
+
+    def payoff_tensor(self):
+        """
+        Two-player payoffs for every pair of integer contributions,
+        shape (2, endowment + 1, endowment + 1).
+        """
+        endowment = self.params['endowment']
+        multiplier = self.params['multiplier']
+        contrib1 = np.arange(0, endowment + 1)[:, None]
+        contrib2 = np.arange(0, endowment + 1)[None, :]
+        individual_return = (contrib1 + contrib2) * multiplier / 2
+        return np.stack([endowment - contrib1 + individual_return,
+                         endowment - contrib2 + individual_return]).astype(float)
@@ -1,4 +1,7 @@
 from .core import GameModel
+from .history import MoveHistory
+from .strategies import FSMStrategy, resolve_strategy
+from .tournament import round_robin
 import numpy as np
 
 class RepeatedPrisonersDilemma(GameModel):
@@ -29,64 +32,39 @@ class RepeatedPrisonersDilemma(GameModel):
         else:
             return T, S
     
-    def play_with_strategies(self, strategy1, strategy2):
+    def play_with_strategies(self, strategy1, strategy2, rng=None, history_path=None):
         """
         Play repeated game with given strategies
         
-        Strategies:
+        Strategies are either ids of the built-in strategies or FSMStrategy
+        objects (see models/strategies.py):
         0: Always Cooperate
         1: Always Betray
         2: Tit-for-Tat (start cooperating, then copy opponent's last move)
         3: Suspicious Tit-for-Tat (start betraying, then copy opponent's last move)
         4: Pavlov (win-stay, lose-shift)
+        
+        The move histories are returned as bit-packed MoveHistory objects; pass
+        history_path to memory-map them to <history_path>_1.bits and
+        <history_path>_2.bits instead of keeping them in memory.
         """
         rounds = self.params['rounds']
         discount = self.params['discount_factor']
+        machine1 = resolve_strategy(strategy1)
+        machine2 = resolve_strategy(strategy2)
         
         # Initialize history and scores
-        history1 = []  # Player 1's moves
-        history2 = []  # Player 2's moves
+        history1 = MoveHistory(rounds, history_path and f"{history_path}_1.bits")  # Player 1's moves
+        history2 = MoveHistory(rounds, history_path and f"{history_path}_2.bits")  # Player 2's moves
         total_score1 = 0
         total_score2 = 0
+        state1 = machine1.initial_state
+        state2 = machine2.initial_state
         
         for r in range(rounds):
-            # Determine actions based on strategies
-            if r == 0:  # First round
-                if strategy1 == 0 or strategy1 == 2:  # Always Cooperate or Tit-for-Tat
-                    action1 = 0  # Cooperate
-                else:  # Always Betray or Suspicious Tit-for-Tat or Pavlov
-                    action1 = 1  # Betray
-                    
-                if strategy2 == 0 or strategy2 == 2:  # Always Cooperate or Tit-for-Tat
-                    action2 = 0  # Cooperate
-                else:  # Always Betray or Suspicious Tit-for-Tat or Pavlov
-                    action2 = 1  # Betray
-            else:  # Subsequent rounds
-                if strategy1 == 0:  # Always Cooperate
-                    action1 = 0
-                elif strategy1 == 1:  # Always Betray
-                    action1 = 1
-                elif strategy1 == 2 or strategy1 == 3:  # Tit-for-Tat or Suspicious Tit-for-Tat
-                    action1 = history2[-1]  # Copy opponent's last move
-                elif strategy1 == 4:  # Pavlov
-                    # If last round was good (CC or DC), repeat action; otherwise change
-                    if (history1[-1] == 0 and history2[-1] == 0) or (history1[-1] == 1 and history2[-1] == 0):
-                        action1 = history1[-1]  # Repeat
-                    else:
-                        action1 = 1 - history1[-1]  # Change
-                
-                if strategy2 == 0:  # Always Cooperate
-                    action2 = 0
-                elif strategy2 == 1:  # Always Betray
-                    action2 = 1
-                elif strategy2 == 2 or strategy2 == 3:  # Tit-for-Tat or Suspicious Tit-for-Tat
-                    action2 = history1[-1]  # Copy opponent's last move
-                elif strategy2 == 4:  # Pavlov
-                    # If last round was good (CC or DC), repeat action; otherwise change
-                    if (history2[-1] == 0 and history1[-1] == 0) or (history2[-1] == 1 and history1[-1] == 0):
-                        action2 = history2[-1]  # Repeat
-                    else:
-                        action2 = 1 - history2[-1]  # Change
+            # Look up each player's move in their strategy's output table
+            action1 = machine1.move(state1, rng)
+            action2 = machine2.move(state2, rng)
             
             # Play the round
             score1, score2 = self.play_single_round(action1, action2)
@@ -95,23 +73,131 @@ class RepeatedPrisonersDilemma(GameModel):
             discount_multiplier = discount ** r
             total_score1 += score1 * discount_multiplier
             total_score2 += score2 * discount_multiplier
-              # Update history
+            
+            # Update history and strategy states
             history1.append(action1)
             history2.append(action2)
+            state1 = machine1.next_state(state1, action1, action2)
+            state2 = machine2.next_state(state2, action2, action1)
         
+        history1.flush()
+        history2.flush()
         return {
             "scores": [total_score1, total_score2],
             "history1": history1,
             "history2": history2
         }
 
+    def play_with_cycle_detection(self, strategy1, strategy2, rounds=None):
+        """
+        Evaluate a match between deterministic strategies in closed form
+        
+        Two deterministic machines revisit a joint state after a short
+        transient and then repeat the same cycle of moves forever, so the
+        discounted and average payoffs are a finite sum plus a geometric
+        series over the cycle. The cost is O(transient + cycle) instead of
+        O(rounds).
+        
+        rounds: whole number of rounds to evaluate (defaults to the model's rounds parameter);
+        pass float('inf') for the infinitely repeated game
+        
+        Returns the discounted "scores", the per-round "average" payoffs, and
+        the "transient" and "cycle_length" of the joint play
+        """
+        rounds = self.params['rounds'] if rounds is None else rounds
+        discount = self.params['discount_factor']
+        machine1 = resolve_strategy(strategy1)
+        machine2 = resolve_strategy(strategy2)
+        if not (machine1.deterministic and machine2.deterministic):
+            raise ValueError("Cycle detection needs deterministic strategies")
+        if rounds == float('inf') and discount >= 1:
+            raise ValueError("The infinitely repeated game needs a discount factor below 1")
+        if rounds != float('inf'):
+            # Finite horizons such as 1e6 index the cycle, so they must be whole numbers
+            if rounds != int(rounds):
+                raise ValueError("A finite number of rounds must be a whole number")
+            rounds = int(rounds)
+
+        # Walk the joint state until it repeats or the horizon ends
+        seen = {}
+        payoffs = []
+        state1 = machine1.initial_state
+        state2 = machine2.initial_state
+        while (state1, state2) not in seen and len(payoffs) < rounds:
+            seen[(state1, state2)] = len(payoffs)
+            action1 = machine1.move(state1)
+            action2 = machine2.move(state2)
+            payoffs.append(self.play_single_round(action1, action2))
+            state1, state2 = machine1.next_state(state1, action1, action2), machine2.next_state(state2, action2, action1)
+        
+        payoffs = np.array(payoffs, dtype=float).reshape(-1, 2)
+        steps = len(payoffs)
+        if (state1, state2) in seen:
+            transient = seen[(state1, state2)]
+        else:
+            # The horizon ended before any state repeated
+            transient = steps
+        cycle_length = steps - transient
+        
+        scores = self._cycle_sum(payoffs, transient, rounds, discount)
+        if rounds == float('inf'):
+            average = payoffs[transient:].mean(axis=0)
+        elif rounds > 0:
+            average = self._cycle_sum(payoffs, transient, rounds, 1.0) / rounds
+        else:
+            average = np.zeros(2)
+        
+        return {
+            "scores": scores.tolist(),
+            "average": average.tolist(),
+            "transient": transient,
+            "cycle_length": cycle_length
+        }
+    
+    @staticmethod
+    def _cycle_sum(payoffs, transient, rounds, discount):
+        """Discounted total over `rounds` rounds of a transient followed by a repeating cycle."""
+        weights = discount ** np.arange(len(payoffs), dtype=float)
+        total = weights[:transient] @ payoffs[:transient]
+        cycle = payoffs[transient:]
+        cycle_length = len(cycle)
+        if cycle_length == 0:
+            return total
+        
+        cycle_weights = weights[:cycle_length]
+        cycle_value = cycle_weights @ cycle
+        start = discount ** transient
+        period = discount ** cycle_length
+        if rounds == float('inf'):
+            return total + start * cycle_value / (1 - period)
+        
+        # Full passes through the cycle, then a partial one
+        full_cycles, remainder = divmod(rounds - transient, cycle_length)
+        if period == 1:
+            repeats = full_cycles
+        else:
+            repeats = (1 - period ** full_cycles) / (1 - period)
+        partial = cycle_weights[:remainder] @ cycle[:remainder]
+        return total + start * (cycle_value * repeats + period ** full_cycles * partial)
+
     def play(self, strategy1, strategy2):
         """Simple interface for playing the game with strategies"""
+        machine1 = resolve_strategy(strategy1)
+        machine2 = resolve_strategy(strategy2)
+        if machine1.deterministic and machine2.deterministic:
+            return self.play_with_cycle_detection(machine1, machine2)["scores"]
         result = self.play_with_strategies(strategy1, strategy2)
         return result["scores"]
     
+    def payoff_tensor(self):
+        """Discounted scores for every pair of strategies, shape (2, 5, 5)."""
+        scores = round_robin(self)["scores"]
+        return np.stack([scores, scores.T])
+
     def get_strategy_name(self, strategy):
         """Return the name of a strategy"""
+        if isinstance(strategy, FSMStrategy):
+            return strategy.name
         strategy_names = {
             0: "Always Cooperate",
             1: "Always Betray",
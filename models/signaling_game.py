@@ -1,6 +1,12 @@
 from .core import GameModel
+from .general_signaling_game import GeneralSignalingGame
 import numpy as np
 
+# Signal sent by the (High, Low) type under each sender strategy; 1 = High signal
+SENDER_PROFILES = np.array([[1, 0], [1, 1], [0, 0], [0, 1]])
+# Action taken after a (Low, High) signal under each receiver strategy; 1 = High action
+RECEIVER_PROFILES = np.array([[0, 1], [1, 0], [1, 1], [0, 0]])
+
 class SignalingGame(GameModel):
     name = "Signaling Game"
     description = "An asymmetric information game where one player knows their type and can send a signal, while the other player must interpret this signal and respond. Models communication when incentives aren't fully aligned."
@@ -35,96 +41,33 @@ class SignalingGame(GameModel):
             2 = Always High (Always take High action regardless of signal)
             3 = Always Low (Always take Low action regardless of signal)
         """
-        # For calculating expected payoffs, we need to consider probabilities
+        if sender_strategy not in range(4):
+            raise ValueError("Invalid sender strategy")
+        if receiver_strategy not in range(4):
+            raise ValueError("Invalid receiver strategy")
+        payoffs = self.general_game().profile_payoffs(SENDER_PROFILES[[sender_strategy]],
+                                                      RECEIVER_PROFILES[[receiver_strategy]])
+        return float(payoffs[0, 0, 0]), float(payoffs[1, 0, 0])
+
+    def general_game(self):
+        """
+        The same game as a GeneralSignalingGame with types (High, Low),
+        signals (Low, High) and actions (Low, High)
+        """
         high_type_prob = self.params['high_type_probability']
-        low_type_prob = 1 - high_type_prob
-        
-        # Payoff parameters
-        high_high = self.params['high_sender_high_signal_payoff']
-        high_low = self.params['high_sender_low_signal_payoff']
-        low_high = self.params['low_sender_high_signal_payoff']
-        low_low = self.params['low_sender_low_signal_payoff']
         correct = self.params['correct_receiver_payoff']
         incorrect = self.params['incorrect_receiver_payoff']
-        
-        # Initialize expected payoffs
-        sender_payoff = 0
-        receiver_payoff = 0
-        
-        # Map sender strategy to signals
-        if sender_strategy == 0:  # Separating
-            high_type_signal = 1  # High signal
-            low_type_signal = 0   # Low signal
-        elif sender_strategy == 1:  # Pooling High
-            high_type_signal = 1  # High signal
-            low_type_signal = 1   # High signal
-        elif sender_strategy == 2:  # Pooling Low
-            high_type_signal = 0  # Low signal
-            low_type_signal = 0   # Low signal
-        elif sender_strategy == 3:  # Perverse
-            high_type_signal = 0  # Low signal
-            low_type_signal = 1   # High signal
-        else:
-            raise ValueError("Invalid sender strategy")
-        
-        # Calculate expected payoffs for High type
-        if high_type_signal == 1:  # High type sends High signal
-            if receiver_strategy == 0:  # Trust: High signal -> High action
-                sender_payoff += high_type_prob * high_high
-                receiver_payoff += high_type_prob * correct
-            elif receiver_strategy == 1:  # Distrust: High signal -> Low action
-                sender_payoff += high_type_prob * high_low
-                receiver_payoff += high_type_prob * incorrect
-            elif receiver_strategy == 2:  # Always High
-                sender_payoff += high_type_prob * high_high
-                receiver_payoff += high_type_prob * correct
-            elif receiver_strategy == 3:  # Always Low
-                sender_payoff += high_type_prob * high_low
-                receiver_payoff += high_type_prob * incorrect
-        else:  # High type sends Low signal
-            if receiver_strategy == 0:  # Trust: Low signal -> Low action
-                sender_payoff += high_type_prob * high_low
-                receiver_payoff += high_type_prob * incorrect
-            elif receiver_strategy == 1:  # Distrust: Low signal -> High action
-                sender_payoff += high_type_prob * high_high
-                receiver_payoff += high_type_prob * correct
-            elif receiver_strategy == 2:  # Always High
-                sender_payoff += high_type_prob * high_high
-                receiver_payoff += high_type_prob * correct
-            elif receiver_strategy == 3:  # Always Low
-                sender_payoff += high_type_prob * high_low
-                receiver_payoff += high_type_prob * incorrect
-        
-        # Calculate expected payoffs for Low type
-        if low_type_signal == 1:  # Low type sends High signal
-            if receiver_strategy == 0:  # Trust: High signal -> High action
-                sender_payoff += low_type_prob * low_high
-                receiver_payoff += low_type_prob * incorrect
-            elif receiver_strategy == 1:  # Distrust: High signal -> Low action
-                sender_payoff += low_type_prob * low_low
-                receiver_payoff += low_type_prob * correct
-            elif receiver_strategy == 2:  # Always High
-                sender_payoff += low_type_prob * low_high
-                receiver_payoff += low_type_prob * incorrect
-            elif receiver_strategy == 3:  # Always Low
-                sender_payoff += low_type_prob * low_low
-                receiver_payoff += low_type_prob * correct
-        else:  # Low type sends Low signal
-            if receiver_strategy == 0:  # Trust: Low signal -> Low action
-                sender_payoff += low_type_prob * low_low
-                receiver_payoff += low_type_prob * correct
-            elif receiver_strategy == 1:  # Distrust: Low signal -> High action
-                sender_payoff += low_type_prob * low_high
-                receiver_payoff += low_type_prob * incorrect
-            elif receiver_strategy == 2:  # Always High
-                sender_payoff += low_type_prob * low_high
-                receiver_payoff += low_type_prob * incorrect
-            elif receiver_strategy == 3:  # Always Low
-                sender_payoff += low_type_prob * low_low
-                receiver_payoff += low_type_prob * correct
-        
-        return sender_payoff, receiver_payoff
-    
+        return GeneralSignalingGame(
+            priors=(high_type_prob, 1 - high_type_prob),
+            sender_payoffs=((self.params['high_sender_low_signal_payoff'], self.params['high_sender_high_signal_payoff']),
+                            (self.params['low_sender_low_signal_payoff'], self.params['low_sender_high_signal_payoff'])),
+            receiver_payoffs=((incorrect, correct), (correct, incorrect))
+        )
+
+    def payoff_tensor(self):
+        """Expected payoffs for every sender/receiver strategy pair, shape (2, 4, 4)."""
+        return self.general_game().profile_payoffs(SENDER_PROFILES, RECEIVER_PROFILES)
+
     def get_sender_strategy_name(self, strategy):
         """Return the name of a sender strategy"""
         strategy_names = {
@@ -0,0 +1,171 @@
+import numpy as np
+from .general_signaling_game import GeneralSignalingGame
+
+
+class SignalingLearners:
+    """
+    Many independent sender/receiver pairs learning to play a signaling game.
+
+    Each trial every pair draws a type from the priors, the sender picks a
+    signal and the receiver an action from their current propensities, and
+    both reinforce what they did with the payoff they got. Propensities are
+    stored as (pairs, types, signals) and (pairs, signals, actions) arrays, so
+    one trial for every pair is a few gathers and scatter-adds.
+
+    Parameters:
+    - game: a GeneralSignalingGame, or a model with a general_game() method
+      such as SignalingGame
+    - pairs: number of independent sender/receiver pairs
+    - method: "roth_erev" (urn learning: choose in proportion to accumulated
+      payoffs) or "q_learning" (epsilon-greedy on running payoff estimates)
+    - initial_propensity: starting urn weight for every choice (Roth-Erev)
+    - forgetting: fraction of every propensity lost each trial (Roth-Erev)
+    - learning_rate: step size of the Q-value updates
+    - exploration: probability of a uniformly random choice (Q-learning)
+    - seed: seed for the random generator
+
+    Roth-Erev needs non-negative rewards, so payoffs are shifted to make the
+    worst outcome for each player worth zero.
+    """
+
+    METHODS = ("roth_erev", "q_learning")
+
+    def __init__(self, game, pairs=10000, method="roth_erev", initial_propensity=1.0, forgetting=0.0,
+                 learning_rate=0.1, exploration=0.05, seed=None):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method '{method}'")
+        if not isinstance(game, GeneralSignalingGame):
+            game = game.general_game()
+        self.game = game
+        self.pairs = pairs
+        self.method = method
+        self.forgetting = forgetting
+        self.learning_rate = learning_rate
+        self.exploration = exploration
+        self.rng = np.random.default_rng(seed)
+
+        # sender_rewards[t, m, a] and receiver_rewards[t, a]
+        self.sender_rewards = game.sender_payoffs[:, None, :] - game.signal_costs[:, :, None]
+        self.receiver_rewards = game.receiver_payoffs.copy()
+        if method == "roth_erev":
+            self.sender_rewards -= self.sender_rewards.min()
+            self.receiver_rewards -= self.receiver_rewards.min()
+
+        start = initial_propensity if method == "roth_erev" else 0.0
+        self.sender_propensities = np.full((pairs, game.num_types, game.num_signals), start)
+        self.receiver_propensities = np.full((pairs, game.num_signals, game.num_actions), start)
+        self.trial = 0
+        self._type_cdf = np.cumsum(game.priors)
+        self._reward_sum = 0.0
+        self._success_sum = 0.0
+        self._trials_since_record = 0
+
+    def strategies(self, explore=True):
+        """
+        Current mixed strategies: sender (pairs, types, signals) and receiver
+        (pairs, signals, actions). With explore=False Q-learners report their
+        greedy policy without exploration.
+        """
+        if self.method == "roth_erev":
+            return (self.sender_propensities / self.sender_propensities.sum(axis=2, keepdims=True),
+                    self.receiver_propensities / self.receiver_propensities.sum(axis=2, keepdims=True))
+        exploration = self.exploration if explore else 0.0
+        return _epsilon_greedy(self.sender_propensities, exploration), \
+            _epsilon_greedy(self.receiver_propensities, exploration)
+
+    def _choose(self, propensities):
+        if self.method == "roth_erev":
+            return _sample(propensities, self.rng)
+        greedy = propensities.argmax(axis=1)
+        explore = self.rng.random(len(propensities)) < self.exploration
+        return np.where(explore, self.rng.integers(0, propensities.shape[1], len(propensities)), greedy)
+
+    def step(self):
+        """Play and learn from one trial in every pair."""
+        game = self.game
+        rows = np.arange(self.pairs)
+        types = np.minimum(np.searchsorted(self._type_cdf, self.rng.random(self.pairs), side='right'),
+                           game.num_types - 1)
+        signals = self._choose(self.sender_propensities[rows, types])
+        actions = self._choose(self.receiver_propensities[rows, signals])
+        sender_reward = self.sender_rewards[types, signals, actions]
+        receiver_reward = self.receiver_rewards[types, actions]
+
+        if self.method == "roth_erev":
+            if self.forgetting:
+                self.sender_propensities *= 1 - self.forgetting
+                self.receiver_propensities *= 1 - self.forgetting
+            self.sender_propensities[rows, types, signals] += sender_reward
+            self.receiver_propensities[rows, signals, actions] += receiver_reward
+        else:
+            sender_q = self.sender_propensities[rows, types, signals]
+            receiver_q = self.receiver_propensities[rows, signals, actions]
+            self.sender_propensities[rows, types, signals] = sender_q + self.learning_rate * (sender_reward - sender_q)
+            self.receiver_propensities[rows, signals, actions] = receiver_q + self.learning_rate * (receiver_reward - receiver_q)
+
+        self.trial += 1
+        self._reward_sum += float(receiver_reward.mean())
+        self._success_sum += float(np.mean(game.receiver_payoffs[types, actions] == game.receiver_payoffs[types].max(axis=1)))
+        self._trials_since_record += 1
+
+    def statistics(self, converged_threshold=0.99):
+        """
+        Convergence statistics over all pairs.
+
+        - efficiency: the receiver's expected payoff under the current mixed
+          strategies (greedy policies for Q-learning) as a share of what full
+          information would give (payoffs are measured from the worst outcome)
+        - information: mutual information between type and signal in bits
+        - converged_share: share of pairs with efficiency above converged_threshold
+        - success_rate, mean_reward: realised since the previous call
+        """
+        game = self.game
+        sender, receiver = self.strategies(explore=False)
+        outcome = np.einsum('t,ptm,pma->pta', game.priors, sender, receiver)
+        payoffs = game.receiver_payoffs - game.receiver_payoffs.min()
+        best = game.priors @ payoffs.max(axis=1)
+        efficiency = np.einsum('pta,ta->p', outcome, payoffs) / best if best > 0 else np.ones(self.pairs)
+
+        joint = game.priors[None, :, None] * sender
+        signal_probability = joint.sum(axis=1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            terms = joint * np.log2(joint / (game.priors[None, :, None] * signal_probability))
+        information = np.nansum(terms, axis=(1, 2))
+
+        trials = max(self._trials_since_record, 1)
+        stats = {
+            "trial": self.trial,
+            "mean_efficiency": float(efficiency.mean()),
+            "efficiency_quartiles": np.percentile(efficiency, [25, 50, 75]),
+            "converged_share": float(np.mean(efficiency >= converged_threshold)),
+            "mean_information": float(information.mean()),
+            "success_rate": self._success_sum / trials,
+            "mean_reward": self._reward_sum / trials
+        }
+        self._reward_sum = self._success_sum = 0.0
+        self._trials_since_record = 0
+        return stats
+
+    def run(self, trials, record_every=100):
+        """
+        Run several trials, yielding statistics() every record_every trials so
+        long runs can be streamed without storing every trial.
+        """
+        for _ in range(trials):
+            self.step()
+            if self.trial % record_every == 0:
+                yield self.statistics()
+
+
+def _sample(weights, rng):
+    """Draw one index per row of weights (n, k) with probability proportional to the weights."""
+    cumulative = np.cumsum(weights, axis=1)
+    draws = rng.random(len(weights)) * cumulative[:, -1]
+    return np.minimum((cumulative <= draws[:, None]).sum(axis=1), weights.shape[1] - 1)
+
+
+def _epsilon_greedy(values, exploration):
+    choices = values.shape[-1]
+    policy = np.full(values.shape, exploration / choices)
+    np.put_along_axis(policy, values.argmax(axis=-1)[..., None], 1 - exploration + exploration / choices, axis=-1)
+    return policy
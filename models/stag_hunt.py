@@ -1,10 +1,11 @@
-from .core import GameModel
+from .core import GameModel, bimatrix
 
 class StagHunt(GameModel):
     name = "Stag Hunt"
     description = "A game model with both cooperation and risk, examining trust and collaboration."
     row_labels = ["Hunt Stag", "Hunt Hare"]
     col_labels = ["Hunt Stag", "Hunt Hare"]
+    vectorized_params = True
 
     def __init__(self, stag=4, hare=2, fail=0):
         super().__init__({'stag': stag, 'hare': hare, 'fail': fail})
@@ -20,3 +21,8 @@ class StagHunt(GameModel):
             return fail, hare
         else:
             return hare, fail
+
+    def payoff_tensor(self):
+        stag, hare, fail = self.params['stag'], self.params['hare'], self.params['fail']
+        return bimatrix([[stag, fail], [hare, hare]],
+                        [[stag, hare], [fail, hare]])
@@ -0,0 +1,198 @@
+import numpy as np
+
+# Moves
+COOPERATE = 0
+BETRAY = 1
+
+
+def outcome_index(own, opponent):
+    """Index of a joint outcome from one player's point of view: CC=0, CD=1, DC=2, DD=3."""
+    return 2 * own + opponent
+
+
+class FSMStrategy:
+    """
+    A repeated-game strategy stored as a finite-state machine.
+
+    - outputs[state]: probability of betraying in that state (0 or 1 for
+      deterministic machines)
+    - transitions[state, outcome]: next state after the round, where outcome
+      is outcome_index(own move, opponent move)
+    - initial_state: state used for the first round
+
+    A move and a state update are each a single table lookup, so adding a new
+    strategy never touches the simulation loops.
+    """
+
+    def __init__(self, name, outputs, transitions, initial_state=0):
+        self.name = name
+        self.outputs = np.asarray(outputs, dtype=float)
+        self.transitions = np.asarray(transitions, dtype=np.int16)
+        self.initial_state = int(initial_state)
+
+        num_states = len(self.outputs)
+        if self.transitions.shape != (num_states, 4):
+            raise ValueError("Transitions must have shape (states, 4)")
+        if (self.outputs < 0).any() or (self.outputs > 1).any():
+            raise ValueError("Outputs must be probabilities of betraying")
+        if self.transitions.min() < 0 or self.transitions.max() >= num_states:
+            raise ValueError("Transitions must point at existing states")
+        if not 0 <= self.initial_state < num_states:
+            raise ValueError("Initial state must be an existing state")
+
+    @property
+    def num_states(self):
+        return len(self.outputs)
+
+    @property
+    def deterministic(self):
+        return bool(np.isin(self.outputs, (0, 1)).all())
+
+    def move(self, state, rng=None):
+        """Return the move played in the given state."""
+        p = self.outputs[state]
+        if p == 0 or p == 1:
+            return int(p)
+        rng = rng or np.random.default_rng()
+        return int(rng.random() < p)
+
+    def next_state(self, state, own, opponent):
+        """Return the state after a round with the given moves."""
+        return int(self.transitions[state, outcome_index(own, opponent)])
+
+    def key(self):
+        """Hashable description of the machine's behaviour, used to deduplicate populations."""
+        return (self.outputs.tobytes(), self.transitions.tobytes(), self.initial_state)
+
+    def __repr__(self):
+        return f"FSMStrategy({self.name!r}, states={self.num_states})"
+
+
+def always_cooperate():
+    return FSMStrategy("Always Cooperate", [0], [[0, 0, 0, 0]])
+
+
+def always_betray():
+    return FSMStrategy("Always Betray", [1], [[0, 0, 0, 0]])
+
+
+def tit_for_tat():
+    # State = opponent's last move
+    return FSMStrategy("Tit-for-Tat", [0, 1], [[0, 1, 0, 1], [0, 1, 0, 1]])
+
+
+def suspicious_tit_for_tat():
+    return FSMStrategy("Suspicious Tit-for-Tat", [0, 1], [[0, 1, 0, 1], [0, 1, 0, 1]], initial_state=1)
+
+
+def pavlov():
+    # State = own next move: repeat after the opponent cooperates, switch after they betray.
+    # Starts by betraying, like the original built-in Pavlov.
+    return FSMStrategy("Pavlov (Win-Stay, Lose-Shift)", [0, 1], [[0, 1, 1, 0], [0, 1, 1, 0]], initial_state=1)
+
+
+def grim_trigger():
+    # Cooperates until the opponent betrays once, then betrays forever
+    return FSMStrategy("Grim Trigger", [0, 1], [[0, 1, 0, 1], [1, 1, 1, 1]])
+
+
+def generous_tit_for_tat(generosity=1/3):
+    # Like Tit-for-Tat, but forgives a betrayal with the given probability
+    return FSMStrategy(f"Generous Tit-for-Tat ({generosity:.2f})", [0, 1 - generosity],
+                       [[0, 1, 0, 1], [0, 1, 0, 1]])
+
+
+def memory_n(n, outputs, initial_state=0, name=None):
+    """
+    Strategy that reacts to the last n joint outcomes.
+
+    State s encodes the last n outcomes in base 4, the most recent in the
+    lowest digit, so there are 4**n states. outputs[s] is the probability of
+    betraying after history s. The default initial state 0 treats the game as
+    if it began after n rounds of mutual cooperation.
+    """
+    num_states = 4 ** n
+    outputs = np.asarray(outputs, dtype=float)
+    if outputs.shape != (num_states,):
+        raise ValueError(f"A memory-{n} strategy needs {num_states} outputs")
+    states = np.arange(num_states)[:, None]
+    transitions = (states * 4 + np.arange(4)[None, :]) % num_states
+    return FSMStrategy(name or f"Memory-{n}", outputs, transitions, initial_state)
+
+
+def random_machine(num_states, rng=None, name="Evolved"):
+    """Random deterministic machine, e.g. as a starting point for evolving strategies."""
+    rng = rng or np.random.default_rng()
+    outputs = rng.integers(0, 2, num_states)
+    transitions = rng.integers(0, num_states, (num_states, 4))
+    return FSMStrategy(name, outputs, transitions, rng.integers(0, num_states))
+
+
+# Strategies addressed by integer id in RepeatedPrisonersDilemma
+BUILTIN_STRATEGIES = [always_cooperate(), always_betray(), tit_for_tat(), suspicious_tit_for_tat(), pavlov()]
+
+
+def resolve_strategy(strategy):
+    """Accept either a built-in strategy id or an FSMStrategy."""
+    if isinstance(strategy, FSMStrategy):
+        return strategy
+    if isinstance(strategy, (int, np.integer)) and 0 <= strategy < len(BUILTIN_STRATEGIES):
+        return BUILTIN_STRATEGIES[strategy]
+    raise ValueError("Invalid strategy")
+
+
+class StrategyTable:
+    """
+    Many FSM strategies packed into padded arrays for batched execution.
+
+    Machine k's outputs and transitions live in row k; a batch of matches is
+    advanced with one gather per array, whatever the mix of machines.
+    """
+
+    def __init__(self, machines):
+        self.machines = list(machines)
+        max_states = max(machine.num_states for machine in self.machines)
+
+        self.outputs = np.zeros((len(self.machines), max_states))
+        self.transitions = np.zeros((len(self.machines), max_states, 4), dtype=np.int16)
+        self.initial_states = np.array([machine.initial_state for machine in self.machines], dtype=np.int16)
+        for k, machine in enumerate(self.machines):
+            self.outputs[k, :machine.num_states] = machine.outputs
+            self.transitions[k, :machine.num_states] = machine.transitions
+
+        self.max_states = max_states
+        self.deterministic = all(machine.deterministic for machine in self.machines)
+        self._flat_outputs = self.outputs.ravel()
+        self._flat_transitions = self.transitions.ravel()
+
+    def moves(self, machines, states, rng=None):
+        """Moves of the given machines in the given states."""
+        p = self._flat_outputs[machines * self.max_states + states]
+        if self.deterministic:
+            return p.astype(np.int8)
+        rng = rng or np.random.default_rng()
+        return (rng.random(len(p)) < p).astype(np.int8)
+
+    def advance(self, machines, states, own, opponent):
+        """Next states of the given machines after a round with the given moves."""
+        index = (machines * self.max_states + states) * 4 + outcome_index(own, opponent)
+        return self._flat_transitions[index]
+
+
+def build_table(strategies):
+    """
+    Pack a population of strategies (ids or FSMStrategy objects) into a StrategyTable.
+
+    Identical machines share a row. Returns (table, machine index per population member).
+    """
+    rows = {}
+    machines = []
+    index = np.empty(len(strategies), dtype=np.intp)
+    for i, strategy in enumerate(strategies):
+        machine = resolve_strategy(strategy)
+        key = machine.key()
+        if key not in rows:
+            rows[key] = len(machines)
+            machines.append(machine)
+        index[i] = rows[key]
+    return StrategyTable(machines), index
@@ -0,0 +1,122 @@
+from concurrent.futures import ProcessPoolExecutor
+import inspect
+import os
+import numpy as np
+import pandas as pd
+
+
+def sweep(model_class, param_ranges, chunk_size=50000, processes=None):
+    """
+    Evaluate payoffs, pure and mixed equilibria and welfare over a grid of model parameters.
+
+    Parameters:
+    - model_class: a GameModel subclass, e.g. PrisonersDilemma
+    - param_ranges: dict mapping parameter names to the values to scan
+      (e.g. {'T': np.linspace(3, 8, 51), 'S': range(-3, 3)}); parameters that
+      are left out keep their constructor defaults
+    - chunk_size: number of grid points evaluated together in one vectorized call
+    - processes: worker processes for the chunks (None = all CPUs, 1 = run inline)
+
+    Returns:
+    - DataFrame with one row per grid point: the parameters, payoff{p}_{i}_{j}
+      for every action profile, ne_{i}_{j} (profile is a pure Nash equilibrium),
+      pure_equilibria, max_welfare, equilibrium_welfare (best pure equilibrium),
+      and for 2x2 games mixed_p1 / mixed_p2 (probability of action 0 in the
+      fully mixed equilibrium, NaN if there is none) and mixed_welfare
+    """
+    defaults = {
+        name: parameter.default
+        for name, parameter in inspect.signature(model_class.__init__).parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+    unknown = set(param_ranges) - set(defaults)
+    if unknown:
+        raise ValueError(f"Unknown parameters for {model_class.__name__}: {sorted(unknown)}")
+
+    names = list(defaults)
+    axes = [np.atleast_1d(np.asarray(param_ranges.get(name, defaults[name]))) for name in names]
+    total = int(np.prod([len(axis) for axis in axes]))
+    starts = range(0, total, chunk_size)
+    tasks = [(model_class, names, axes, start, min(start + chunk_size, total)) for start in starts]
+
+    if processes == 1 or len(tasks) == 1:
+        frames = [_evaluate_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+            frames = list(executor.map(_evaluate_chunk, tasks))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def _evaluate_chunk(task):
+    """Evaluate grid points [start, stop) of the flattened parameter grid."""
+    model_class, names, axes, start, stop = task
+    indices = np.unravel_index(np.arange(start, stop), [len(axis) for axis in axes])
+    params = {name: axis[index] for name, axis, index in zip(names, axes, indices)}
+
+    if model_class.vectorized_params:
+        payoffs = model_class(**params).payoff_tensor()
+        # A tensor that does not depend on any parameter comes back without a batch axis
+        payoffs = np.broadcast_to(payoffs, payoffs.shape[:3] + (stop - start,))
+    else:
+        payoffs = np.stack([
+            model_class(**{name: values[i].item() for name, values in params.items()}).payoff_tensor()
+            for i in range(stop - start)
+        ], axis=-1)
+
+    if payoffs.ndim != 4 or payoffs.shape[0] != 2:
+        raise ValueError("Parameter sweeps need a two-player bimatrix game")
+
+    columns = dict(params)
+    columns.update(payoff_grid_summary(payoffs))
+    return pd.DataFrame(columns)
+
+
+def payoff_grid_summary(payoffs):
+    """
+    Equilibrium and welfare statistics for a stack of bimatrix games.
+
+    payoffs has shape (2, |A1|, |A2|, points); every statistic is computed for
+    all points at once and returned as a dict of column arrays.
+    """
+    A, B = payoffs[0], payoffs[1]
+    rows, cols = A.shape[0], A.shape[1]
+    welfare = A + B
+
+    # A profile is a pure equilibrium when neither player gains by deviating alone
+    pure_ne = (A >= A.max(axis=0, keepdims=True)) & (B >= B.max(axis=1, keepdims=True))
+
+    columns = {}
+    for i in range(rows):
+        for j in range(cols):
+            columns[f"payoff1_{i}_{j}"] = A[i, j]
+            columns[f"payoff2_{i}_{j}"] = B[i, j]
+    for i in range(rows):
+        for j in range(cols):
+            columns[f"ne_{i}_{j}"] = pure_ne[i, j]
+
+    columns["pure_equilibria"] = pure_ne.sum(axis=(0, 1))
+    columns["max_welfare"] = welfare.max(axis=(0, 1))
+    columns["equilibrium_welfare"] = np.where(pure_ne, welfare, -np.inf).max(axis=(0, 1))
+    columns["equilibrium_welfare"][~pure_ne.any(axis=(0, 1))] = np.nan
+
+    if (rows, cols) == (2, 2):
+        columns.update(_mixed_equilibrium_2x2(A, B))
+    return columns
+
+
+def _mixed_equilibrium_2x2(A, B):
+    """Closed-form fully mixed equilibrium of 2x2 games from the indifference conditions."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Player 2's mix q makes player 1 indifferent, and vice versa
+        q = (A[1, 1] - A[0, 1]) / (A[0, 0] - A[0, 1] - A[1, 0] + A[1, 1])
+        p = (B[1, 1] - B[1, 0]) / (B[0, 0] - B[1, 0] - B[0, 1] + B[1, 1])
+
+    valid = (p > 0) & (p < 1) & (q > 0) & (q < 1)
+    p = np.where(valid, p, np.nan)
+    q = np.where(valid, q, np.nan)
+
+    row_mix = np.stack([p, 1 - p])
+    col_mix = np.stack([q, 1 - q])
+    welfare = np.einsum('ik,ijk,jk->k', row_mix, A + B, col_mix)
+    return {"mixed_p1": p, "mixed_p2": q, "mixed_welfare": welfare}
@@ -0,0 +1,166 @@
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+import os
+import numpy as np
+from .strategies import BUILTIN_STRATEGIES, build_table
+
+
+def round_robin(model, strategies=None, rng=None):
+    """
+    Play every pair of strategies against each other in lockstep.
+
+    All matchups advance together one round at a time as NumPy arrays, so the
+    cost per round is a handful of array operations regardless of how many
+    pairs there are. Strategies that appear several times in a population are
+    packed into one machine and each distinct pairing is played once.
+
+    Parameters:
+    - model: a RepeatedPrisonersDilemma supplying payoffs, rounds and discount factor
+    - strategies: population of strategy ids (0-4) or FSMStrategy objects;
+      defaults to each built-in strategy once
+    - rng: numpy Generator, only used by stochastic strategies
+
+    Returns:
+    - dict with "scores", an (N, N) matrix where scores[i, j] is the discounted
+      score of strategies[i] playing against strategies[j], and "strategies"
+    """
+    if strategies is None:
+        strategies = list(range(len(BUILTIN_STRATEGIES)))
+
+    table, machines = build_table(strategies)
+    unique, inverse = np.unique(machines, return_inverse=True)
+    row, col = np.triu_indices(len(unique))
+    score1, score2 = play_pairs(model, table, unique[row], unique[col], rng)
+
+    # Each simulated pair fills both orientations of the matrix
+    scores = np.zeros((len(unique), len(unique)))
+    scores[row, col] = score1
+    scores[col, row] = score2
+
+    return {
+        "scores": scores[np.ix_(inverse, inverse)],
+        "strategies": strategies
+    }
+
+
+def noisy_tournament(model, strategies=None, matches=1000, implementation_error=0.0,
+                     perception_error=0.0, seed=None, chunk_size=1000000, processes=None,
+                     confidence=0.95):
+    """
+    Monte Carlo round robin with trembling-hand and mis-perception noise.
+
+    Every distinct pair of strategies plays `matches` independent noisy
+    matches. The matches are split into chunks of about `chunk_size` simulated
+    matches, each with its own RNG stream spawned from one SeedSequence, so
+    the result depends only on `seed` and not on how many processes run the
+    chunks.
+
+    Parameters:
+    - model: a RepeatedPrisonersDilemma
+    - strategies: population of strategy ids or FSMStrategy objects
+    - matches: matches per pair of strategies
+    - implementation_error: probability that a move is flipped when played
+    - perception_error: probability that a player misreads the opponent's move
+    - seed: seed for the root SeedSequence
+    - processes: worker processes (None = all CPUs, 1 = run inline)
+    - confidence: level of the normal-approximation confidence intervals
+
+    Returns:
+    - dict of (N, N) matrices for the row strategy's score against the column
+      strategy: "mean", "std_error", "ci_low", "ci_high", plus "matches"
+    """
+    if strategies is None:
+        strategies = list(range(len(BUILTIN_STRATEGIES)))
+
+    table, machines = build_table(strategies)
+    unique, inverse = np.unique(machines, return_inverse=True)
+    row, col = np.triu_indices(len(unique))
+
+    matches_per_chunk = max(1, chunk_size // len(row))
+    chunk_matches = [min(matches_per_chunk, matches - start) for start in range(0, matches, matches_per_chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_matches))
+    tasks = [(model, table, unique[row], unique[col], n, implementation_error, perception_error, chunk_seed)
+             for n, chunk_seed in zip(chunk_matches, seeds)]
+
+    if processes == 1 or len(tasks) == 1:
+        results = [_noisy_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+            results = list(executor.map(_noisy_chunk, tasks))
+
+    # Sums and sums of squares per pair: columns are (score1, score2)
+    totals = sum(result[0] for result in results)
+    squares = sum(result[1] for result in results)
+    mean = totals / matches
+    variance = np.maximum(squares / matches - mean ** 2, 0) * matches / max(matches - 1, 1)
+    std_error = np.sqrt(variance / matches)
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    result = {"matches": matches}
+    for name, values in [("mean", mean), ("std_error", std_error),
+                         ("ci_low", mean - z * std_error), ("ci_high", mean + z * std_error)]:
+        matrix = np.zeros((len(unique), len(unique)))
+        matrix[row, col] = values[:, 0]
+        matrix[col, row] = values[:, 1]
+        result[name] = matrix[np.ix_(inverse, inverse)]
+    return result
+
+
+def _noisy_chunk(task):
+    """Play one chunk of noisy matches and return per-pair score sums and sums of squares."""
+    model, table, machines1, machines2, matches, implementation_error, perception_error, seed = task
+    rng = np.random.default_rng(seed)
+
+    score1, score2 = play_pairs(model, table, np.repeat(machines1, matches), np.repeat(machines2, matches),
+                                rng, implementation_error, perception_error)
+    scores = np.stack([score1, score2], axis=1).reshape(len(machines1), matches, 2)
+    return scores.sum(axis=1), (scores ** 2).sum(axis=1)
+
+
+def play_pairs(model, table, machines1, machines2, rng=None, implementation_error=0.0, perception_error=0.0):
+    """
+    Play many repeated matches at once, one per (machines1[k], machines2[k]) pair.
+
+    machines1 and machines2 index rows of the StrategyTable. With
+    implementation_error each intended move is flipped with that probability;
+    with perception_error each player independently misreads the opponent's
+    move when updating its state. Returns the arrays of discounted scores for
+    both sides.
+    """
+    R, T, S, P = model.params['R'], model.params['T'], model.params['S'], model.params['P']
+    rounds = model.params['rounds']
+    discount = model.params['discount_factor']
+    payoffs = np.array([[[R, S], [T, P]],
+                        [[R, T], [S, P]]], dtype=float)
+
+    if not table.deterministic or implementation_error > 0 or perception_error > 0:
+        rng = rng or np.random.default_rng()
+
+    machines1 = np.asarray(machines1, dtype=np.intp)
+    machines2 = np.asarray(machines2, dtype=np.intp)
+    state1 = table.initial_states[machines1]
+    state2 = table.initial_states[machines2]
+    score1 = np.zeros(len(machines1))
+    score2 = np.zeros(len(machines2))
+
+    multiplier = 1.0
+    for _ in range(rounds):
+        action1 = table.moves(machines1, state1, rng)
+        action2 = table.moves(machines2, state2, rng)
+        if implementation_error > 0:
+            action1 = action1 ^ (rng.random(len(action1)) < implementation_error)
+            action2 = action2 ^ (rng.random(len(action2)) < implementation_error)
+
+        score1 += payoffs[0, action1, action2] * multiplier
+        score2 += payoffs[1, action1, action2] * multiplier
+        multiplier *= discount
+
+        if perception_error > 0:
+            seen_by1 = action2 ^ (rng.random(len(action2)) < perception_error)
+            seen_by2 = action1 ^ (rng.random(len(action1)) < perception_error)
+        else:
+            seen_by1, seen_by2 = action2, action1
+        state1 = table.advance(machines1, state1, action1, seen_by1)
+        state2 = table.advance(machines2, state2, action2, seen_by2)
+
+    return score1, score2
@@ -1,4 +1,5 @@
 from .core import GameModel
+import numpy as np
 
 class TrustGame(GameModel):
     name = "Trust Game"
@@ -29,6 +30,25 @@ class TrustGame(GameModel):
         
         return payoff_sender, payoff_receiver
         
+    def play_batch(self, amounts_sent, amount_returned_ratios):
+        """
+        Vectorized play() over arrays of amounts sent and return ratios.
+
+        Returns (sender_payoffs, receiver_payoffs) arrays.
+        """
+        initial_amount = self.params['initial_amount']
+        multiplier = self.params['multiplier']
+
+        amounts_sent = np.clip(amounts_sent, 0, initial_amount)
+        amount_returned_ratios = np.clip(amount_returned_ratios, 0, 1)
+
+        multiplied_amount = amounts_sent * multiplier
+        amount_returned = multiplied_amount * amount_returned_ratios
+
+        payoff_sender = initial_amount - amounts_sent + amount_returned
+        payoff_receiver = multiplied_amount - amount_returned
+        return payoff_sender, payoff_receiver
+
     def play_simple(self, send_choice, return_choice):
         # Simplified version for the web interface
         # send_choice: 0=Low Trust, 1=Medium Trust, 2=High Trust
@@ -54,3 +74,15 @@ class TrustGame(GameModel):
         return_ratio = return_ratios[return_choice]
         
         return self.play(amount_sent, return_ratio)
+
+    def payoff_tensor(self):
+        """Payoffs for the three send levels (rows) and three return levels (columns), shape (2, 3, 3)."""
+        initial_amount = self.params['initial_amount']
+        multiplier = self.params['multiplier']
+
+        amount_sent = initial_amount * np.array([0.2, 0.5, 0.8])[:, None]
+        return_ratio = np.array([0.1, 0.3, 0.5])[None, :]
+        multiplied_amount = amount_sent * multiplier
+        amount_returned = multiplied_amount * return_ratio
+        return np.stack([initial_amount - amount_sent + amount_returned,
+                         multiplied_amount - amount_returned]).astype(float)
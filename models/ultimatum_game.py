@@ -37,6 +37,125 @@ class UltimatumGame(GameModel):
         
         return proposer_payoff, responder_payoff
     
+    def play_batch(self, offer_amounts, accept_thresholds):
+        """
+        Vectorized play() over arrays of offers and acceptance thresholds.
+
+        Returns (proposer_payoffs, responder_payoffs) arrays.
+        """
+        total = self.params['total_amount']
+        offer_amounts = np.clip(offer_amounts, 0, total)
+        accept_thresholds = np.clip(accept_thresholds, 0, total)
+
+        accepted = offer_amounts >= accept_thresholds
+        proposer_payoff = np.where(accepted, total - offer_amounts, 0)
+        responder_payoff = np.where(accepted, offer_amounts, 0)
+        return proposer_payoff, responder_payoff
+
+    def payoff_tensor(self):
+        """
+        Payoffs for every integer offer (rows) and acceptance threshold (columns),
+        shape (2, total_amount + 1, total_amount + 1).
+        """
+        total = self.params['total_amount']
+        offers = np.arange(0, total + 1)[:, None]
+        thresholds = np.arange(0, total + 1)[None, :]
+        accepted = offers >= thresholds
+        return np.stack([np.where(accepted, total - offers, 0),
+                         np.where(accepted, offers, 0)]).astype(float)
+
+    def payoff_grid(self, offers=None, thresholds=None, resolution=1001):
+        """
+        Payoffs for every offer x acceptance threshold combination in one shot
+        
+        offers, thresholds: amounts to evaluate; by default `resolution` evenly
+        spaced amounts from 0 to total_amount
+        
+        Returns a dict with the "offers" and "thresholds" axes and the
+        "proposer" and "responder" payoff grids of shape (len(offers), len(thresholds))
+        """
+        total = self.params['total_amount']
+        if offers is None:
+            offers = np.linspace(0, total, resolution)
+        if thresholds is None:
+            thresholds = np.linspace(0, total, resolution)
+        offers = np.asarray(offers, dtype=float)
+        thresholds = np.asarray(thresholds, dtype=float)
+        
+        proposer, responder = self.play_batch(offers[:, None], thresholds[None, :])
+        return {
+            "offers": offers,
+            "thresholds": thresholds,
+            "proposer": proposer,
+            "responder": responder
+        }
+    
+    def simulate_population(self, n_agents=1000000, generations=1000, mutation_rate=0.01, mutation_scale=0.05,
+                            selection_strength=1.0, initial_offer=None, initial_threshold=None, bins=20,
+                            record_every=1, seed=None):
+        """
+        Evolve offer and acceptance-threshold distributions in a large population
+        
+        Every agent has an offer and a threshold, stored as fractions of
+        total_amount. Each generation agents are randomly paired, once as
+        proposer and once as responder. Each then compares payoffs with a random
+        other agent and copies that agent's (offer, threshold) with the Fermi
+        probability 1 / (1 + exp(-s * payoff difference / total_amount)).
+        Finally a mutation_rate fraction of traits get Gaussian noise. Every
+        step is a whole-population array operation.
+        
+        initial_offer, initial_threshold: arrays or scalars in [0, 1]
+        (uniformly random by default)
+        
+        Yields a summary dict every record_every generations with the mean
+        offer and threshold (as fractions), the acceptance rate, the mean
+        payoff, and histograms of offers and thresholds over `bins` bins
+        """
+        total = self.params['total_amount']
+        rng = np.random.default_rng(seed)
+        
+        def initial(values):
+            if values is None:
+                return rng.random(n_agents, dtype=np.float32)
+            return np.broadcast_to(np.asarray(values, dtype=np.float32), (n_agents,)).copy()
+        
+        offers = initial(initial_offer)
+        thresholds = initial(initial_threshold)
+        edges = np.linspace(0, 1, bins + 1)
+        
+        for generation in range(1, generations + 1):
+            # Agent k proposes to partners[k]; everyone is a responder exactly once
+            partners = rng.permutation(n_agents)
+            proposer_payoff, responder_payoff = self.play_batch(offers * total, thresholds[partners] * total)
+            # Recorded before imitation and mutation overwrite the traits
+            accepted = offers >= thresholds[partners]
+            payoffs = proposer_payoff.astype(np.float32)
+            payoffs[partners] += responder_payoff
+            
+            # Imitation of a random role model
+            models = rng.integers(0, n_agents, n_agents)
+            # 1 / (1 + exp(-s * difference)) written with tanh so large differences cannot overflow
+            adopt_probability = 0.5 * (1 + np.tanh(selection_strength * (payoffs[models] - payoffs) / total / 2))
+            adopt = rng.random(n_agents, dtype=np.float32) < adopt_probability
+            offers = np.where(adopt, offers[models], offers)
+            thresholds = np.where(adopt, thresholds[models], thresholds)
+            
+            # Mutation
+            for traits in (offers, thresholds):
+                mutants = np.flatnonzero(rng.random(n_agents, dtype=np.float32) < mutation_rate)
+                traits[mutants] = np.clip(traits[mutants] + rng.normal(0, mutation_scale, len(mutants)), 0, 1)
+            
+            if generation % record_every == 0:
+                yield {
+                    "generation": generation,
+                    "mean_offer": float(offers.mean()),
+                    "mean_threshold": float(thresholds.mean()),
+                    "acceptance_rate": float(accepted.mean()),
+                    "mean_payoff": float(payoffs.mean()),
+                    "offer_histogram": np.histogram(offers, edges)[0],
+                    "threshold_histogram": np.histogram(thresholds, edges)[0]
+                }
+    
     def play_with_strategy(self, proposer_strategy, responder_strategy):
         """
         Play the game with predefined strategies
@@ -9,20 +9,10 @@ def plot_payoff_matrix(model, title="Payoff Matrix"):
     """
     # Create the payoff matrix
     try:
-        # For 2x2 games (most common)
-        p1_matrix = np.zeros((2, 2))
-        p2_matrix = np.zeros((2, 2))
-        text_matrix = []
-        
-        # Get the payoffs for each combination
-        for i, a1 in enumerate([0, 1]):
-            text_row = []
-            for j, a2 in enumerate([0, 1]):
-                p1, p2 = model.play(a1, a2)
-                p1_matrix[i, j] = p1
-                p2_matrix[i, j] = p2
-                text_row.append(f"{p1}, {p2}")
-            text_matrix.append(text_row)
+        payoffs = model.payoff_tensor()
+        p1_matrix = payoffs[0]
+        p2_matrix = payoffs[1]
+        text_matrix = model.get_payoff_matrix().tolist()
         
         # Get action labels (if they exist)
         row_labels = getattr(model, 'row_labels', ['Action 0', 'Action 1'])
@@ -56,8 +46,8 @@ def plot_payoff_matrix(model, title="Payoff Matrix"):
         payoff_range = max_payoff - min_payoff if max_payoff > min_payoff else 1
         
         # Add color to cells
-        for i in range(2):
-            for j in range(2):
+        for i in range(p1_matrix.shape[0]):
+            for j in range(p1_matrix.shape[1]):
                 # Normalize payoff to [0, 1] for color scaling
                 normalized_payoff = (p1_matrix[i, j] - min_payoff) / payoff_range
                 # Create a blue color with intensity based on the payoff
@@ -72,6 +62,18 @@ def plot_payoff_matrix(model, title="Payoff Matrix"):
         st.warning(f"Could not generate payoff matrix: {str(e)}")
         return None
 
+def describe_equilibrium(x, y, row_labels, col_labels):
+    """
+    Return a readable description of a (possibly mixed) equilibrium
+    """
+    def describe(strategy, labels):
+        support = [i for i, p in enumerate(strategy) if p > 1e-9]
+        if len(support) == 1:
+            return labels[support[0]]
+        return " / ".join(f"{strategy[i]:.0%} {labels[i]}" for i in support)
+
+    return f"Player 1: {describe(x, row_labels)} | Player 2: {describe(y, col_labels)}"
+
 def get_game_labels(model_name):
     """
     Return appropriate action labels for different games